@@ -2,13 +2,13 @@
 仅生成仪表盘的简化脚本 - 使用已有的公司数据
 """
 import logging
-import pandas as pd
 from pathlib import Path
 from src.data_enrichment.company_enricher import CompanyEnricher
 from src.data_enrichment.stakeholder_finder import StakeholderFinder
 from src.outreach.message_generator import MessageGenerator
 from src.visualization.dashboard_generator import DashboardGenerator
-from src.config.config import OUTPUT_DATA_DIR
+from src.config.config import OUTPUT_DATA_DIR, CACHE_DIR
+from src.utils.data_io import read_csv_cached
 
 # 设置日志
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
@@ -23,7 +23,7 @@ def main():
     output_dir.mkdir(parents=True, exist_ok=True)
     
     # 加载已有的公司数据
-    companies_df = pd.read_csv("data/processed/test_companies.csv")
+    companies_df = read_csv_cached("data/processed/test_companies.csv", CACHE_DIR / "csv")
     logger.info(f"已加载 {len(companies_df)} 家公司的数据")
     
     # 步骤1: 丰富公司数据
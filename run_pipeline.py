@@ -1,8 +1,11 @@
 """
 Main script - Execute the entire data processing and dashboard generation pipeline
 """
+import argparse
 import logging
+import orjson
 import pandas as pd
+import pyarrow as pa
 from pathlib import Path
 from src.data_collection.event_scraper import EventScraper
 from src.data_collection.association_scraper import AssociationScraper
@@ -11,14 +14,67 @@ from src.data_enrichment.company_enricher import CompanyEnricher
 from src.data_enrichment.stakeholder_finder import StakeholderFinder
 from src.outreach.message_generator import MessageGenerator
 from src.visualization.dashboard_generator import DashboardGenerator
-from src.config.config import OUTPUT_DATA_DIR
+from src.utils.data_io import write_csv, write_parquet, read_parquet
+from src.config.config import OUTPUT_DATA_DIR, CACHE_DIR
 
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-def main():
-    """Main function to execute the entire data processing and dashboard generation pipeline"""
+# Cached stage outputs, reused on reruns while they are newer than their inputs
+STAGE_CACHE_DIR = CACHE_DIR / "pipeline"
+
+def run_stage(name, compute, upstreams=(), settings=None, refresh=False):
+    """Run a pipeline stage, reusing its cached output when it is up to date
+    
+    A cached output is up to date when it is newer than the cached outputs
+    of every stage it depends on and was computed with the same settings.
+    Only the settings passed in are tracked; code changes, such as edited
+    prompts or templates, still need a refresh.
+    
+    Args:
+        name (str): Stage name, used for the cache file name
+        compute (callable): Function computing the stage DataFrame
+        upstreams (tuple): Names of the stages this stage depends on
+        settings (dict, optional): JSON-serializable settings the output depends on,
+            such as model names or scoring weights
+        refresh (bool): Recompute the stage even if its cached output is up to date
+        
+    Returns:
+        pandas.DataFrame: Stage output
+    """
+    STAGE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    cache_path = STAGE_CACHE_DIR / f"{name}.parquet"
+    settings_path = STAGE_CACHE_DIR / f"{name}.settings.json"
+    upstream_paths = [STAGE_CACHE_DIR / f"{upstream}.parquet" for upstream in upstreams]
+    settings_json = orjson.dumps(settings, option=orjson.OPT_SORT_KEYS) if settings is not None else None
+    
+    if (not refresh and cache_path.exists() and
+            all(path.exists() and path.stat().st_mtime < cache_path.stat().st_mtime for path in upstream_paths) and
+            (settings_json is None or (settings_path.exists() and settings_path.read_bytes() == settings_json))):
+        logger.info(f"Using cached {name} from {cache_path}")
+        return read_parquet(cache_path)
+    
+    df = compute()
+    
+    try:
+        write_parquet(df, cache_path)
+        if settings_json is not None:
+            settings_path.write_bytes(settings_json)
+    except (ValueError, TypeError, pa.ArrowException) as e:
+        # Remove any stale cache so downstream stages are recomputed too
+        cache_path.unlink(missing_ok=True)
+        settings_path.unlink(missing_ok=True)
+        logger.warning(f"Could not cache {name}: {str(e)}")
+    
+    return df
+
+def main(refresh=False):
+    """Main function to execute the entire data processing and dashboard generation pipeline
+    
+    Args:
+        refresh (bool): Recompute every stage instead of reusing cached outputs
+    """
     logger.info("Starting data processing and dashboard generation pipeline")
     
     # Create output directory
@@ -28,36 +84,52 @@ def main():
     # Step 1: Collect event data
     logger.info("Step 1: Collecting event data")
     event_scraper = EventScraper()
-    events_df = event_scraper.get_events_data()
-    events_df.to_csv(output_dir / "events.csv", index=False)
+    events_df = run_stage('events', event_scraper.get_events_data, refresh=refresh)
+    write_csv(events_df, output_dir / "events.csv")
     logger.info(f"Collected {len(events_df)} events")
     
     # Step 2: Collect association data
     logger.info("Step 2: Collecting association data")
     association_scraper = AssociationScraper()
-    associations_df = association_scraper.collect_associations_data()
-    associations_df.to_csv(output_dir / "associations.csv", index=False)
+    associations_df = run_stage('associations', association_scraper.collect_associations_data, refresh=refresh)
+    write_csv(associations_df, output_dir / "associations.csv")
     logger.info(f"Collected {len(associations_df)} associations")
     
     # Step 3: Collect company data
     logger.info("Step 3: Collecting company data")
     company_scraper = CompanyScraper()
-    companies_df = company_scraper.collect_companies_data(events_df, associations_df)  # Using the newly added method
-    companies_df.to_csv(output_dir / "companies.csv", index=False)
+    companies_df = run_stage(
+        'companies',
+        lambda: company_scraper.collect_companies_data(events_df, associations_df),  # Using the newly added method
+        upstreams=('events', 'associations'),
+        refresh=refresh
+    )
+    write_csv(companies_df, output_dir / "companies.csv")
     logger.info(f"Collected {len(companies_df)} companies")
     
     # Step 4: Enrich company data
     logger.info("Step 4: Enriching company data")
     company_enricher = CompanyEnricher()
-    enriched_companies_df = company_enricher.enrich_companies(companies_df)
-    enriched_companies_df.to_csv(output_dir / "enriched_companies.csv", index=False)
+    enriched_companies_df = run_stage(
+        'enriched_companies',
+        lambda: company_enricher.enrich_companies(companies_df),
+        upstreams=('companies',),
+        refresh=refresh
+    )
+    write_csv(enriched_companies_df, output_dir / "enriched_companies.csv")
     logger.info(f"Enriched data for {len(enriched_companies_df)} companies")
     
     # Step 5: Find stakeholders
     logger.info("Step 5: Finding stakeholders")
     stakeholder_finder = StakeholderFinder()
-    stakeholders_df = stakeholder_finder.find_stakeholders(enriched_companies_df)
-    stakeholders_df.to_csv(output_dir / "stakeholders.csv", index=False)
+    stakeholders_df = run_stage(
+        'stakeholders',
+        lambda: stakeholder_finder.find_stakeholders(enriched_companies_df),
+        upstreams=('enriched_companies',),
+        refresh=refresh
+    )
+    # StakeholderFinder saves Parquet; keep a CSV export for manual review
+    write_csv(stakeholders_df, output_dir / "stakeholders.csv")
     logger.info(f"Found {len(stakeholders_df)} stakeholders")
     
     # Step 6: Score leads
@@ -65,14 +137,21 @@ def main():
     from src.lead_scoring.lead_scorer import LeadScorer
     lead_scorer = LeadScorer()
     scored_companies_df, scored_stakeholders_df, leads_df = lead_scorer.score_leads(enriched_companies_df, stakeholders_df)
-    leads_df.to_csv(output_dir / "scored_leads.csv", index=False)
+    write_csv(leads_df, output_dir / "scored_leads.csv")
     logger.info(f"Scored {len(leads_df)} leads")
     
     # Step 7: Generate outreach messages
     logger.info("Step 7: Generating outreach messages")
     message_generator = MessageGenerator()
-    stakeholders_with_messages_df = message_generator.generate_messages(scored_stakeholders_df, scored_companies_df)
-    stakeholders_with_messages_df.to_csv(output_dir / "stakeholders_with_messages.csv", index=False)
+    # Messages are built from the uncached scoring step, so its weights are part of the cache key
+    stakeholders_with_messages_df = run_stage(
+        'stakeholders_with_messages',
+        lambda: message_generator.generate_messages(scored_stakeholders_df, scored_companies_df),
+        upstreams=('enriched_companies', 'stakeholders'),
+        settings={'model': message_generator.model, 'scoring_weights': lead_scorer.weights},
+        refresh=refresh
+    )
+    write_csv(stakeholders_with_messages_df, output_dir / "stakeholders_with_messages.csv")
     logger.info(f"Generated outreach messages for {len(stakeholders_with_messages_df)} stakeholders")
     
     # Step 8: Generate dashboard
@@ -89,5 +168,9 @@ def main():
     return dashboard_path
 
 if __name__ == "__main__":
-    dashboard_path = main()
+    parser = argparse.ArgumentParser(description="Run the data processing and dashboard generation pipeline")
+    parser.add_argument('--refresh', action='store_true', help="recompute every stage instead of reusing cached outputs")
+    args = parser.parse_args()
+    
+    dashboard_path = main(refresh=args.refresh)
     print(f"\nDashboard generated. Please open the following file in your browser:\n{dashboard_path}")
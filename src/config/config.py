@@ -14,6 +14,7 @@ DATA_DIR = PROJECT_ROOT / "data"
 RAW_DATA_DIR = DATA_DIR / "raw"
 PROCESSED_DATA_DIR = DATA_DIR / "processed"
 OUTPUT_DATA_DIR = DATA_DIR / "output"
+CACHE_DIR = DATA_DIR / "cache"
 
 # Ensure all data directories exist
 for directory in [RAW_DATA_DIR, PROCESSED_DATA_DIR, OUTPUT_DATA_DIR]:
@@ -32,10 +33,19 @@ TARGET_PRODUCT = "DuPont Tedlar"
 USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
 REQUEST_TIMEOUT = 20  # seconds - reduced timeout
 REQUEST_DELAY = 0.5  # seconds between requests - reduced delay for faster execution
+MAX_CONCURRENT_REQUESTS = 16  # parallel API lookups - kept low to stay under provider rate limits
+HUNTER_RATE_LIMIT = 10  # Hunter.io requests per second
+HUNTER_CACHE_TTL = 7 * 24 * 60 * 60  # seconds - reuse Hunter.io results for a week
+OPENAI_RATE_LIMIT = 5  # OpenAI requests per second
+OPENAI_CACHE_TTL = 7 * 24 * 60 * 60  # seconds - reuse generated messages for a week
+OPENAI_MAX_RETRIES = 5  # retries on OpenAI rate limit and server errors
 
 # Dashboard configuration
 DASHBOARD_TITLE = "DuPont Tedlar Sales Lead Dashboard"
 DASHBOARD_DESCRIPTION = "Interactive dashboard for DuPont Tedlar's Graphics & Signage sales team to prioritize and manage leads."
+DASHBOARD_CHART_CACHE_TTL = 24 * 60 * 60  # seconds - reuse rendered charts for a day
+DASHBOARD_MAX_ROWS = 500  # leads shown in the dashboard table; the full list is linked as CSV
+DASHBOARD_MAX_SCATTER_POINTS = 5000  # stakeholders plotted in the scatter chart; larger sets are sampled
 
 # Scoring weights for lead prioritization
 SCORING_WEIGHTS = {
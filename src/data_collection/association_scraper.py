@@ -205,7 +205,7 @@ class AssociationScraper:
             response.raise_for_status()
             
             # Parse the HTML content
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = BeautifulSoup(response.text, 'lxml')
             
             # Extract additional information
             
@@ -41,6 +41,10 @@ class CompanyScraper:
         self.timeout = REQUEST_TIMEOUT
         self.delay = REQUEST_DELAY
         
+        # Share one session so repeated requests to a site reuse their connections
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        
         # Ensure output directories exist
         self.output_dir = OUTPUT_DATA_DIR
         self.output_dir.mkdir(parents=True, exist_ok=True)
@@ -451,7 +455,7 @@ class CompanyScraper:
             str: URL of the exhibitor list page
         """
         try:
-            response = requests.get(event_url, headers=self.headers, timeout=self.timeout)
+            response = self.session.get(event_url, timeout=self.timeout)
             response.raise_for_status()
             
             soup = BeautifulSoup(response.text, 'lxml')
@@ -493,7 +497,7 @@ class CompanyScraper:
             list: List of dictionaries containing company information
         """
         try:
-            response = requests.get(exhibitor_url, headers=self.headers, timeout=self.timeout)
+            response = self.session.get(exhibitor_url, timeout=self.timeout)
             response.raise_for_status()
             
             soup = BeautifulSoup(response.text, 'lxml')
@@ -563,7 +567,7 @@ class CompanyScraper:
             str: URL of the member directory page
         """
         try:
-            response = requests.get(association_url, headers=self.headers, timeout=self.timeout)
+            response = self.session.get(association_url, timeout=self.timeout)
             response.raise_for_status()
             
             soup = BeautifulSoup(response.text, 'lxml')
@@ -605,7 +609,7 @@ class CompanyScraper:
             list: List of dictionaries containing company information
         """
         try:
-            response = requests.get(directory_url, headers=self.headers, timeout=self.timeout)
+            response = self.session.get(directory_url, timeout=self.timeout)
             response.raise_for_status()
             
             soup = BeautifulSoup(response.text, 'lxml')
@@ -6,7 +6,7 @@ from various sources to improve lead scoring and personalization.
 
 import os
 import logging
-import pandas as pd
+import numpy as np
 import requests
 from pathlib import Path
 import sys
@@ -26,6 +26,7 @@ from src.config.config import (
     REQUEST_DELAY,
     CLEARBIT_API_KEY
 )
+from src.utils.text import count_keyword_matches
 
 
 class CompanyEnricher:
@@ -96,7 +97,7 @@ class CompanyEnricher:
         enriched_df['target_markets'] = enriched_df.apply(self._extract_target_markets, axis=1)
         
         # Calculate relevance score for each company
-        enriched_df['relevance_score'] = enriched_df.apply(self._calculate_relevance_score, axis=1)
+        enriched_df['relevance_score'] = self._calculate_relevance_scores(enriched_df)
         
         # Save enriched companies data
         enriched_df.to_csv(self.output_dir / 'companies_enriched.csv', index=False)
@@ -425,80 +426,52 @@ class CompanyEnricher:
         
         return markets
     
-    def _calculate_relevance_score(self, company):
-        """Calculate relevance score for a company based on its fit for DuPont Tedlar products
+    def _calculate_relevance_scores(self, companies_df):
+        """Calculate relevance scores for all companies based on their fit for DuPont Tedlar products
+        
+        The score is computed column-wise over the whole DataFrame rather than
+        row by row, so the cost stays in pandas/NumPy instead of the interpreter.
         
         Args:
-            company (pandas.Series): Company information
+            companies_df (pandas.DataFrame): DataFrame containing company information
             
         Returns:
-            float: Relevance score between 0 and 1
+            numpy.ndarray: Relevance scores between 0 and 1
         """
-        score = 0.0
         max_score = 5.0  # Maximum possible score
         
         # Score based on industry (0-1 points)
-        industry = str(company.get('industry', '')).lower()
-        if 'sign' in industry or 'display' in industry:
-            score += 1.0
-        elif 'print' in industry or 'graphic' in industry:
-            score += 0.8
-        elif 'advertising' in industry or 'marketing' in industry:
-            score += 0.6
-        elif 'manufacturing' in industry or 'production' in industry:
-            score += 0.5
-        
-        # Score based on products (0-1 points)
-        products = company.get('products', [])
-        if isinstance(products, str):
-            products = [products]
-        
-        product_score = 0.0
-        relevant_products = ['signs', 'banners', 'displays', 'billboards', 'wraps', 'graphics']
-        for product in products:
-            product = str(product).lower()
-            if any(rp in product for rp in relevant_products):
-                product_score += 0.2  # 0.2 points per relevant product, up to 1.0
-        score += min(product_score, 1.0)
-        
-        # Score based on materials (0-1 points)
-        materials = company.get('materials', [])
-        if isinstance(materials, str):
-            materials = [materials]
-        
-        material_score = 0.0
-        relevant_materials = ['vinyl', 'pvc', 'plastic', 'film', 'composite']
-        for material in materials:
-            material = str(material).lower()
-            if any(rm in material for rm in relevant_materials):
-                material_score += 0.2  # 0.2 points per relevant material, up to 1.0
-        score += min(material_score, 1.0)
-        
-        # Score based on target markets (0-1 points)
-        markets = company.get('target_markets', [])
-        if isinstance(markets, str):
-            markets = [markets]
-        
-        market_score = 0.0
-        relevant_markets = ['outdoor advertising', 'retail', 'events', 'transportation']
-        for market in markets:
-            market = str(market).lower()
-            if any(rm in market for rm in relevant_markets):
-                market_score += 0.25  # 0.25 points per relevant market, up to 1.0
-        score += min(market_score, 1.0)
-        
-        # Score based on company size (0-1 points)
-        company_size = str(company.get('company_size', '')).lower()
-        if company_size == 'large':
-            score += 1.0
-        elif company_size == 'medium':
-            score += 0.8
-        elif company_size == 'small':
-            score += 0.5
-        else:  # Micro or unknown
-            score += 0.3
-        
-        # Normalize score to range 0-1
-        normalized_score = score / max_score
-        
-        return round(normalized_score, 2)  # Round to 2 decimal places
\ No newline at end of file
+        industry = companies_df['industry'].fillna('').astype(str).str.lower()
+        industry_score = np.select(
+            [
+                industry.str.contains('sign|display'),
+                industry.str.contains('print|graphic'),
+                industry.str.contains('advertising|marketing'),
+                industry.str.contains('manufacturing|production')
+            ],
+            [1.0, 0.8, 0.6, 0.5],
+            default=0.0
+        )
+        
+        # Score based on products, materials and target markets (0-1 points each)
+        product_counts = count_keyword_matches(
+            companies_df['products'], 'signs|banners|displays|billboards|wraps|graphics')
+        material_counts = count_keyword_matches(
+            companies_df['materials'], 'vinyl|pvc|plastic|film|composite')
+        market_counts = count_keyword_matches(
+            companies_df['target_markets'], 'outdoor advertising|retail|events|transportation')
+        
+        # Score based on company size (0-1 points), micro or unknown gets 0.3
+        company_size = companies_df['company_size'].fillna('').astype(str).str.lower()
+        size_score = company_size.map({'large': 1.0, 'medium': 0.8, 'small': 0.5}).fillna(0.3).to_numpy()
+        
+        score = (
+            industry_score +
+            np.minimum(product_counts * 0.2, 1.0) +
+            np.minimum(material_counts * 0.2, 1.0) +
+            np.minimum(market_counts * 0.25, 1.0) +
+            size_score
+        )
+        
+        # Normalize score to range 0-1 and round to 2 decimal places
+        return np.round(score / max_score, 2)
@@ -7,15 +7,16 @@ at target companies.
 import os
 import logging
 import pandas as pd
-import logging
-import time
-import random
+import numpy as np
+import orjson
 from typing import List, Dict, Any
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from pathlib import Path
 import sys
 import re
-import time
+from concurrent.futures import ThreadPoolExecutor
 
 # Add project root to path
 project_root = Path(__file__).parent.parent.parent
@@ -27,9 +28,20 @@ from src.config.config import (
     OUTPUT_DATA_DIR,
     USER_AGENT,
     REQUEST_TIMEOUT,
-    REQUEST_DELAY,
+    MAX_CONCURRENT_REQUESTS,
+    HUNTER_RATE_LIMIT,
+    HUNTER_CACHE_TTL,
+    CACHE_DIR,
     HUNTER_API_KEY
 )
+from src.utils.rate_limiter import RateLimiter
+from src.utils.cache import FileCache
+from src.utils.data_io import write_parquet
+
+HUNTER_DOMAIN_SEARCH_URL = "https://api.hunter.io/v2/domain-search"
+
+# Matches the protocol and www prefix stripped from website URLs
+_URL_STRIP = re.compile(r'^(?:https?://)?(?:www\.)?')
 
 
 class StakeholderFinder:
@@ -43,15 +55,30 @@ class StakeholderFinder:
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8'
         }
         self.timeout = REQUEST_TIMEOUT
-        self.delay = REQUEST_DELAY
+        self.max_workers = MAX_CONCURRENT_REQUESTS
+        
+        # Random generator used to draw synthetic stakeholders in bulk
+        self.rng = np.random.default_rng()
+        
+        # Share one pooled session so repeated API calls reuse their connections
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        retries = Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504])
+        adapter = HTTPAdapter(pool_connections=self.max_workers, pool_maxsize=self.max_workers, max_retries=retries)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        
+        # Token bucket keeping Hunter.io lookups under the API's request rate
+        self.hunter_limiter = RateLimiter(HUNTER_RATE_LIMIT)
+        
+        # On-disk cache of Hunter.io results keyed by domain, so reruns skip repeat lookups
+        self.hunter_cache = FileCache(CACHE_DIR / 'hunter', HUNTER_CACHE_TTL)
         
         # Ensure output directories exist
         self.output_dir = OUTPUT_DATA_DIR
         self.output_dir.mkdir(parents=True, exist_ok=True)
         
-        # Setup logging
-        logging.basicConfig(level=logging.INFO, 
-                           format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+        # Setup logging; handlers and levels are configured by the entry-point scripts
         self.logger = logging.getLogger(__name__)
         
         # Define relevant job titles for decision makers in the graphics and signage industry
@@ -97,6 +124,25 @@ class StakeholderFinder:
                 'Account Manager', 'Client Relations Manager'
             ]
         }
+        
+        # Decision-making power for each title category, checked in the order above
+        self.category_scores = {
+            'executive': 0.9,  # Highest decision power
+            'marketing': 0.7,  # Medium-high decision power
+            'operations': 0.8,  # High decision power
+            'purchasing': 0.8,
+            'technical': 0.7,
+            'sales': 0.6  # Medium decision power
+        }
+        
+        # One compiled alternation per category instead of one substring test per title
+        self.title_patterns = {
+            category: re.compile('|'.join(re.escape(title.lower()) for title in titles))
+            for category, titles in self.relevant_titles.items()
+        }
+        
+        # Scores for titles already seen, since the same titles recur across stakeholders
+        self._title_score_cache = {}
     
     def find_stakeholders(self, companies_df):
         """Find key stakeholders at target companies
@@ -109,40 +155,52 @@ class StakeholderFinder:
         """
         self.logger.info(f"Finding stakeholders for {len(companies_df)} companies")
         
-        all_stakeholders = []
+        # Work on positional labels so stakeholders can be put back in company order
+        companies = companies_df.reset_index(drop=True)
         
-        for _, company in companies_df.iterrows():
-            company_name = company['name']
-            company_domain = self._extract_domain(company.get('website', ''))
-            
-            self.logger.info(f"Finding stakeholders for {company_name}")
-            
-            # Try to find stakeholders using Hunter.io API if available
-            if HUNTER_API_KEY and company_domain:
-                stakeholders = self._find_stakeholders_with_hunter(company_domain, company_name)
-                if stakeholders:
-                    all_stakeholders.extend(stakeholders)
-                    self.logger.info(f"Found {len(stakeholders)} stakeholders for {company_name} using Hunter.io")
-                    
-                    # Respect rate limits but use a minimal delay to speed up processing
-                    time.sleep(self.delay / 2)  # Use half the configured delay to speed up processing
-                    continue
+        # Look up companies with a known domain on Hunter.io concurrently,
+        # searching each domain only once even if several companies share it
+        company_domains = {}
+        lookups = {}
+        if HUNTER_API_KEY and 'website' in companies.columns:
+            domains = self._extract_domains(companies['website'])
+            for position, (company_domain, company_name) in enumerate(zip(domains, companies['name'])):
+                if company_domain:
+                    company_domains[position] = company_domain
+                    lookups.setdefault(company_domain, (company_domain, company_name))
+        hunter_results = self._find_stakeholders_with_hunter_concurrently(lookups)
+        
+        hunter_stakeholders = []
+        hunter_positions = []
+        synthetic_positions = []
+        
+        for position, company_name in enumerate(companies['name']):
+            stakeholders = hunter_results.get(company_domains.get(position))
+            if stakeholders:
+                hunter_stakeholders.extend({**stakeholder, 'company': company_name} for stakeholder in stakeholders)
+                hunter_positions.extend([position] * len(stakeholders))
+                self.logger.info(f"Found {len(stakeholders)} stakeholders for {company_name} using Hunter.io")
+                continue
             
-            # If Hunter.io API is not available or no stakeholders found, generate synthetic stakeholders
-            synthetic_stakeholders = self._generate_synthetic_stakeholders(company)
-            all_stakeholders.extend(synthetic_stakeholders)
-            self.logger.info(f"Generated {len(synthetic_stakeholders)} synthetic stakeholders for {company_name}")
+            # If Hunter.io API is not available or no stakeholders found, fall back to synthetic stakeholders
+            synthetic_positions.append(position)
         
-        # Create DataFrame from all stakeholders
-        stakeholders_df = pd.DataFrame(all_stakeholders)
+        # Generate synthetic stakeholders for all remaining companies in one pass
+        synthetic_df = self._generate_synthetic_stakeholders(companies.iloc[synthetic_positions])
+        self.logger.info(f"Generated {len(synthetic_df)} synthetic stakeholders for {len(synthetic_positions)} companies")
+        
+        # Combine both sources, keeping stakeholders grouped in company order
+        hunter_df = pd.DataFrame(hunter_stakeholders, index=hunter_positions)
+        stakeholders_df = pd.concat([hunter_df, synthetic_df]).sort_index(kind='stable').reset_index(drop=True)
         
         # Add unique ID for each stakeholder if not already present
         if 'id' not in stakeholders_df.columns:
-            stakeholders_df['id'] = [f"STAKE-{i:04d}" for i in range(1, len(stakeholders_df) + 1)]
+            ids = np.char.zfill(np.arange(1, len(stakeholders_df) + 1).astype(str), 4)
+            stakeholders_df['id'] = np.char.add('STAKE-', ids)
         
         # Save stakeholders data
-        stakeholders_df.to_csv(self.output_dir / 'stakeholders.csv', index=False)
-        self.logger.info(f"Saved {len(stakeholders_df)} stakeholders to stakeholders.csv")
+        write_parquet(stakeholders_df, self.output_dir / 'stakeholders.parquet')
+        self.logger.info(f"Saved {len(stakeholders_df)} stakeholders to stakeholders.parquet")
         
         return stakeholders_df
     
@@ -158,15 +216,47 @@ class StakeholderFinder:
         if not url or not isinstance(url, str):
             return ''
         
-        # Remove protocol and www
-        domain = url.lower()
-        domain = re.sub(r'^https?://', '', domain)
-        domain = re.sub(r'^www\.', '', domain)
+        # Remove protocol and www, then path and query string
+        return _URL_STRIP.sub('', url.lower()).split('/', 1)[0]
+    
+    def _extract_domains(self, urls):
+        """Extract domains from a column of website URLs in a single pass
         
-        # Remove path and query string
-        domain = domain.split('/')[0]
+        Args:
+            urls (pandas.Series): Website URLs
+            
+        Returns:
+            pandas.Series: Domain names, empty where the URL is missing
+        """
+        # Non-string values come out of the string methods as missing
+        domains = (urls.astype(object).str.lower()
+                   .str.replace(_URL_STRIP, '', regex=True)
+                   .str.split('/', n=1).str[0])
+        return domains.fillna('')
+    
+    def _find_stakeholders_with_hunter_concurrently(self, lookups):
+        """Find stakeholders for several companies using Hunter.io API in parallel
         
-        return domain
+        Args:
+            lookups (dict): Mapping of a key to a (domain, company_name) pair
+            
+        Returns:
+            dict: Mapping of each key to its list of stakeholder dictionaries
+        """
+        if not lookups:
+            return {}
+        
+        def lookup(domain, company_name):
+            self.logger.info(f"Finding stakeholders for {company_name}")
+            return self._find_stakeholders_with_hunter(domain, company_name)
+        
+        # The lookups are network-bound, so a bounded thread pool overlaps the waits
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {
+                key: executor.submit(lookup, domain, company_name)
+                for key, (domain, company_name) in lookups.items()
+            }
+            return {key: future.result() for key, future in futures.items()}
     
     def _find_stakeholders_with_hunter(self, domain, company_name):
         """Find stakeholders using Hunter.io API
@@ -181,13 +271,20 @@ class StakeholderFinder:
         if not HUNTER_API_KEY or not domain:
             return []
         
+        cached = self.hunter_cache.get(domain)
+        if cached is not None:
+            self.logger.info(f"Using cached Hunter.io results for {company_name}")
+            return cached
+        
         try:
-            url = f"https://api.hunter.io/v2/domain-search?domain={domain}&api_key={HUNTER_API_KEY}"
+            params = {'domain': domain, 'api_key': HUNTER_API_KEY}
             
-            response = requests.get(url, headers=self.headers, timeout=self.timeout)
+            # Wait for the rate limiter instead of sleeping a fixed delay after each call
+            self.hunter_limiter.acquire()
+            response = self.session.get(HUNTER_DOMAIN_SEARCH_URL, params=params, timeout=self.timeout)
             
             if response.status_code == 200:
-                data = response.json()
+                data = orjson.loads(response.content)
                 
                 if 'data' in data and 'emails' in data['data']:
                     stakeholders = []
@@ -219,6 +316,7 @@ class StakeholderFinder:
                         
                         stakeholders.append(stakeholder)
                     
+                    self.hunter_cache.set(domain, stakeholders)
                     return stakeholders
                 
                 self.logger.warning(f"No email data found for {company_name} in Hunter.io response")
@@ -243,70 +341,100 @@ class StakeholderFinder:
         if not title or not isinstance(title, str):
             return 0.5  # Default medium score
         
-        title = title.lower()
-        
-        # Check against relevant titles
-        for category, titles in self.relevant_titles.items():
-            for relevant_title in titles:
-                if relevant_title.lower() in title:
-                    # Assign scores based on category
-                    if category == 'executive':
-                        return 0.9  # Highest decision power
-                    elif category in ['purchasing', 'operations']:
-                        return 0.8  # High decision power
-                    elif category in ['technical', 'marketing']:
-                        return 0.7  # Medium-high decision power
-                    elif category == 'sales':
-                        return 0.6  # Medium decision power
-        
-        # Default score for unknown titles
-        return 0.5
+        if title in self._title_score_cache:
+            return self._title_score_cache[title]
+        
+        lowered = title.lower()
+        
+        # The first matching category wins, with a default score for unknown titles
+        score = 0.5
+        for category, pattern in self.title_patterns.items():
+            if pattern.search(lowered):
+                score = self.category_scores[category]
+                break
+        
+        self._title_score_cache[title] = score
+        return score
     
-    def _generate_synthetic_stakeholders(self, company):
-        """Generate synthetic stakeholders for a company when real data is not available
+    def _calculate_decision_powers(self, titles):
+        """Calculate decision-making power scores for a column of job titles
         
         Args:
-            company (pandas.Series): Company information
+            titles (pandas.Series): Job titles
             
         Returns:
-            list: List of dictionaries containing synthetic stakeholder information
+            numpy.ndarray: Decision-making power scores (0-1)
         """
-        company_name = company['name']
-        stakeholders = []
+        lowered = titles.astype(object).str.lower()
+        conditions = []
+        choices = []
+        for category, pattern in self.title_patterns.items():
+            conditions.append(lowered.str.contains(pattern, na=False).to_numpy(dtype=bool))
+            choices.append(self.category_scores[category])
         
-        # Generate 2-4 synthetic stakeholders per company
-        num_stakeholders = random.randint(2, 4)
+        # np.select takes the first true condition, matching the category order
+        return np.select(conditions, choices, default=0.5)
+    
+    def _generate_synthetic_stakeholders(self, companies):
+        """Generate synthetic stakeholders for companies when real data is not available
         
-        # Select random categories for stakeholders
-        categories = random.sample(list(self.relevant_titles.keys()), min(num_stakeholders, len(self.relevant_titles)))
+        All stakeholders are drawn in bulk with NumPy and assembled column-wise,
+        instead of building one dictionary per stakeholder.
         
-        for i, category in enumerate(categories):
-            # Select a random title from the category
-            title = random.choice(self.relevant_titles[category])
-            
-            # Generate a synthetic name
-            first_name = f"FirstName{i+1}"
-            last_name = f"LastName{i+1}"
-            
-            # Generate a synthetic email
-            domain = self._extract_domain(company.get('website', ''))
-            if not domain:
-                domain = company_name.lower().replace(' ', '') + '.com'
-            email = f"{first_name.lower()}.{last_name.lower()}@{domain}"
-            
-            # Create stakeholder record
-            stakeholder = {
-                'first_name': first_name,
-                'last_name': last_name,
-                'name': f"{first_name} {last_name}",
-                'email': email,
-                'title': title,
-                'company': company_name,
-                'linkedin_url': '',
-                'source': 'Synthetic',
-                'decision_making_power': self._calculate_decision_power_from_title(title)
-            }
+        Args:
+            companies (pandas.DataFrame): Companies that need synthetic stakeholders
             
-            stakeholders.append(stakeholder)
+        Returns:
+            pandas.DataFrame: DataFrame containing synthetic stakeholder information,
+                indexed by the index label of each stakeholder's company
+        """
+        if companies.empty:
+            return pd.DataFrame()
+        
+        categories = list(self.relevant_titles.keys())
+        num_companies = len(companies)
+        
+        # Generate 2-4 synthetic stakeholders per company
+        counts = np.minimum(self.rng.integers(2, 5, size=num_companies), len(categories))
+        repeat_idx = np.repeat(np.arange(num_companies), counts)
+        
+        # Select distinct random categories per company: the first `count` entries of a random permutation
+        permutations = np.argsort(self.rng.random((num_companies, len(categories))), axis=1)
+        category_idx = permutations[np.arange(len(categories)) < counts[:, None]]
+        
+        # Select a random title from each stakeholder's category
+        title_lists = [self.relevant_titles[category] for category in categories]
+        title_counts = np.array([len(titles) for titles in title_lists])
+        title_offsets = np.cumsum(title_counts) - title_counts
+        all_titles = np.array([title for titles in title_lists for title in titles], dtype=object)
+        title_choice = self.rng.integers(0, title_counts[category_idx])
+        titles = all_titles[title_offsets[category_idx] + title_choice]
+        
+        # Generate synthetic names numbered per company
+        slot = np.arange(len(repeat_idx)) - np.repeat(np.cumsum(counts) - counts, counts) + 1
+        slot = pd.Series(slot).astype(str)
+        first_names = 'FirstName' + slot
+        last_names = 'LastName' + slot
+        
+        # Generate synthetic emails, falling back to a domain built from the company name
+        company_names = companies['name'].reset_index(drop=True)
+        if 'website' in companies.columns:
+            domains = self._extract_domains(companies['website'].reset_index(drop=True))
+        else:
+            domains = pd.Series('', index=company_names.index)
+        fallback_domains = company_names.str.lower().str.replace(' ', '', regex=False) + '.com'
+        domains = domains.where(domains != '', fallback_domains)
+        emails = (first_names.str.lower() + '.' + last_names.str.lower() + '@' +
+                  domains.iloc[repeat_idx].reset_index(drop=True))
         
-        return stakeholders
\ No newline at end of file
+        return pd.DataFrame({
+            'first_name': first_names.to_numpy(),
+            'last_name': last_names.to_numpy(),
+            'name': (first_names + ' ' + last_names).to_numpy(),
+            'email': emails.to_numpy(),
+            'title': titles,
+            'company': company_names.iloc[repeat_idx].to_numpy(),
+            'linkedin_url': '',
+            'source': 'Synthetic',
+            'decision_making_power': self._calculate_decision_powers(pd.Series(titles))
+        }, index=companies.index[repeat_idx])
@@ -8,6 +8,7 @@ import os
 import logging
 import pandas as pd
 import numpy as np
+import re
 from pathlib import Path
 import sys
 
@@ -19,6 +20,7 @@ from src.config.config import (
     OUTPUT_DATA_DIR,
     SCORING_WEIGHTS
 )
+from src.utils.text import count_keyword_matches
 
 
 class LeadScorer:
@@ -37,6 +39,35 @@ class LeadScorer:
         
         # Scoring weights from config
         self.weights = SCORING_WEIGHTS
+        
+        # Keyword patterns, compiled once and shared by every scoring pass
+        self.relevant_industry_pattern = re.compile('sign|graphic|print|display|advertising')
+        self.description_keyword_patterns = [
+            re.compile(keyword) for keyword in
+            ['sign', 'graphic', 'print', 'display', 'banner', 'billboard', 'exhibit', 'vinyl', 'pvc', 'film']
+        ]
+        
+        # Industry tiers: highly, very, somewhat and less relevant industries
+        self.industry_tier_patterns = [
+            (re.compile('sign|signage|display'), 1.0),
+            (re.compile('graphic|print|advertising'), 0.8),
+            (re.compile('marketing|media|visual|design|exhibition'), 0.6),
+            (re.compile('manufacturing|production|retail|construction'), 0.4)
+        ]
+        
+        self.relevant_product_pattern = re.compile('sign|banner|display|billboard|graphic|wrap|exhibit')
+        self.relevant_material_pattern = re.compile('vinyl|pvc|plastic|film|composite')
+        
+        # Company size categories stored as integer codes, with the score for each code
+        self.company_size_dtype = pd.CategoricalDtype(['micro', 'small', 'medium', 'large'], ordered=True)
+        self.company_size_scores = np.array([0.2, 0.4, 0.7, 1.0])
+        
+        # Title tiers: executive, director/VP and manager roles
+        self.title_tier_patterns = [
+            (re.compile('ceo|chief|president|owner|founder|managing director'), 1.0),
+            (re.compile('director|vp|vice president|head'), 0.8),
+            (re.compile('manager|lead|senior|principal'), 0.6)
+        ]
     
     def score_leads(self, companies_df, stakeholders_df):
         """Score and prioritize leads based on company and stakeholder information
@@ -59,10 +90,7 @@ class LeadScorer:
         # Generate leads by combining company and stakeholder scores
         leads_df = self._generate_leads(scored_companies_df, scored_stakeholders_df)
         
-        # Save leads data for dashboard
-        leads_df.to_csv(self.output_dir / 'dashboard_data.csv', index=False)
-        self.logger.info(f"Saved {len(leads_df)} leads to dashboard_data.csv")
-        
+        # Saving is left to the caller, which writes the leads once as scored_leads.csv
         return scored_companies_df, scored_stakeholders_df, leads_df
     
     def _score_companies(self, companies_df):
@@ -74,39 +102,36 @@ class LeadScorer:
         Returns:
             pandas.DataFrame: DataFrame containing scored companies
         """
-        # Create a copy of the DataFrame to avoid modifying the original
-        scored_df = companies_df.copy()
+        # Lowercase the text columns once for all scorers; assign returns a new
+        # DataFrame, so the original is left unmodified without a full copy
+        scored_df = self._add_lowercase_columns(companies_df)
         
         # Ensure relevance_score exists
         if 'relevance_score' not in scored_df.columns:
             self.logger.warning("No relevance_score found in companies_df, calculating basic score")
-            scored_df['relevance_score'] = scored_df.apply(self._calculate_basic_relevance, axis=1)
+            scored_df['relevance_score'] = self._calculate_basic_relevance_scores(scored_df).astype(np.float32)
+        
+        # Scores are in range 0-1 with 2 decimal places, so float32 is precise enough at half the memory
         
         # Calculate company size score
-        scored_df['size_score'] = scored_df.apply(self._calculate_size_score, axis=1)
+        scored_df['size_score'] = self._calculate_size_scores(scored_df).astype(np.float32)
         
         # Calculate industry relevance score
-        scored_df['industry_score'] = scored_df.apply(self._calculate_industry_score, axis=1)
+        scored_df['industry_score'] = self._calculate_industry_scores(scored_df).astype(np.float32)
         
         # Calculate product fit score
-        scored_df['product_fit_score'] = scored_df.apply(self._calculate_product_fit, axis=1)
+        scored_df['product_fit_score'] = self._calculate_product_fit_scores(scored_df).astype(np.float32)
         
-        # Calculate overall company score
-        scored_df['company_score'] = (
-            scored_df['size_score'] * self.weights['company_size'] +
-            scored_df['industry_score'] * self.weights['industry_relevance'] +
-            scored_df['product_fit_score'] * self.weights['product_fit']
+        # Calculate overall company score, normalized to range 0-1
+        company_score = (
+            scored_df['size_score'].to_numpy() * self.weights['company_size'] +
+            scored_df['industry_score'].to_numpy() * self.weights['industry_relevance'] +
+            scored_df['product_fit_score'].to_numpy() * self.weights['product_fit']
         )
+        scored_df['company_score'] = self._normalize_scores(company_score)
         
-        # Normalize scores to range 0-1
-        max_score = scored_df['company_score'].max()
-        if max_score > 0:
-            scored_df['company_score'] = scored_df['company_score'] / max_score
-        
-        # Round scores to 2 decimal places
-        scored_df['company_score'] = scored_df['company_score'].round(2)
-        
-        return scored_df
+        # Drop the lowercased helper columns
+        return scored_df.drop(columns=[col for col in scored_df.columns if col.startswith('_') and col.endswith('_lc')])
     
     def _score_stakeholders(self, stakeholders_df, companies_df):
         """Score stakeholders based on decision-making power and company score
@@ -118,44 +143,41 @@ class LeadScorer:
         Returns:
             pandas.DataFrame: DataFrame containing scored stakeholders
         """
-        # Create a copy of the DataFrame to avoid modifying the original
-        scored_df = stakeholders_df.copy()
-        
         # Ensure decision_making_power exists
-        if 'decision_making_power' not in scored_df.columns:
+        if 'decision_making_power' in stakeholders_df.columns:
+            decision_making_power = stakeholders_df['decision_making_power']
+        else:
             self.logger.warning("No decision_making_power found in stakeholders_df, calculating from title")
-            scored_df['decision_making_power'] = scored_df.apply(self._calculate_decision_power_from_title, axis=1)
+            decision_making_power = pd.Series(self._calculate_decision_powers(stakeholders_df), index=stakeholders_df.index)
         
         # Merge with company scores
         if 'company_score' in companies_df.columns:
-            # Create a mapping of company names to scores
+            # Create a mapping of company names to scores; a dict lookup via map is
+            # much cheaper than a merge for this single-key, one-to-many join
             company_scores = dict(zip(companies_df['name'], companies_df['company_score']))
             
-            # Add company score to stakeholders
-            scored_df['company_score'] = scored_df['company'].map(company_scores)
-            
-            # Fill missing values with median
-            median_score = companies_df['company_score'].median()
-            scored_df['company_score'] = scored_df['company_score'].fillna(median_score)
+            # Look up company scores, filling missing values with median; the median
+            # is only computed when some stakeholders have no scored company
+            company_score = stakeholders_df['company'].map(company_scores)
+            missing = company_score.isna()
+            if missing.any():
+                company_score = company_score.mask(missing, companies_df['company_score'].median())
         else:
             # If no company scores available, use a default value
-            scored_df['company_score'] = 0.5
+            company_score = pd.Series(0.5, index=stakeholders_df.index)
         
-        # Calculate stakeholder priority score
-        scored_df['stakeholder_score'] = (
-            scored_df['decision_making_power'] * self.weights['decision_making_power'] +
-            scored_df['company_score'] * (1 - self.weights['decision_making_power'])
+        # Calculate stakeholder priority score, normalized to range 0-1
+        stakeholder_score = (
+            decision_making_power.to_numpy(dtype=np.float32) * self.weights['decision_making_power'] +
+            company_score.to_numpy(dtype=np.float32) * (1 - self.weights['decision_making_power'])
         )
         
-        # Normalize scores to range 0-1
-        max_score = scored_df['stakeholder_score'].max()
-        if max_score > 0:
-            scored_df['stakeholder_score'] = scored_df['stakeholder_score'] / max_score
-        
-        # Round scores to 2 decimal places
-        scored_df['stakeholder_score'] = scored_df['stakeholder_score'].round(2)
-        
-        return scored_df
+        # Only the score columns are new; assign leaves the original DataFrame unmodified
+        return stakeholders_df.assign(
+            decision_making_power=decision_making_power.astype(np.float32),
+            company_score=company_score.astype(np.float32),
+            stakeholder_score=self._normalize_scores(stakeholder_score)
+        )
     
     def _generate_leads(self, companies_df, stakeholders_df):
         """Generate leads by combining company and stakeholder information
@@ -167,14 +189,19 @@ class LeadScorer:
         Returns:
             pandas.DataFrame: DataFrame containing leads with combined scores
         """
-        # Merge stakeholders with company information
-        leads_df = pd.merge(
-            stakeholders_df,
-            companies_df[['name', 'industry', 'company_size', 'company_score', 'relevance_score', 'products', 'materials', 'target_markets']],
-            left_on='company',
-            right_on='name',
-            suffixes=('', '_company')
-        )
+        # Company names are the lookup key, so each stakeholder must match exactly one company;
+        # as with the company_score mapping in _score_stakeholders, the last duplicate wins
+        duplicated = companies_df['name'].duplicated(keep='last')
+        if duplicated.any():
+            self.logger.warning(f"Found {duplicated.sum()} duplicate company names, keeping the last entry for each")
+            companies_df = companies_df[~duplicated]
+        
+        # Keep stakeholders of known companies, then look up company information by name;
+        # stakeholders already carry their company_score from _score_stakeholders
+        companies_indexed = companies_df.set_index('name')[['industry', 'company_size', 'products', 'materials', 'target_markets']]
+        leads_df = stakeholders_df[stakeholders_df['company'].isin(companies_indexed.index)].copy()
+        for col in companies_indexed.columns:
+            leads_df[col] = leads_df['company'].map(companies_indexed[col])
         
         # Calculate final lead score
         leads_df['lead_score'] = (leads_df['company_score'] * 0.6) + (leads_df['stakeholder_score'] * 0.4)
@@ -182,18 +209,21 @@ class LeadScorer:
         # Round scores to 2 decimal places
         leads_df['lead_score'] = leads_df['lead_score'].round(2)
         
-        # Sort by lead score in descending order
-        leads_df = leads_df.sort_values('lead_score', ascending=False)
+        # Sort by lead score in descending order; a stable sort keeps stakeholders with
+        # equal scores in their original order so lead IDs are reproducible
+        leads_df = leads_df.sort_values('lead_score', ascending=False, kind='stable', ignore_index=True)
         
-        # Add lead tier based on score
-        leads_df['tier'] = pd.cut(
-            leads_df['lead_score'],
-            bins=[0, 0.3, 0.6, 1.0],
-            labels=['Tier 3', 'Tier 2', 'Tier 1']
-        )
+        # Add lead tier based on score: (0, 0.3] is Tier 3, (0.3, 0.6] Tier 2 and (0.6, 1.0] Tier 1,
+        # leaving scores outside those bins without a tier
+        # Bin edges are compared as float32 so that a float32 score of 0.3 stays in the 0.3 bin
+        scores = leads_df['lead_score'].to_numpy()
+        edges = np.array([1.0, 0.6, 0.3, 0], dtype=np.float32)
+        tier_codes = np.select([scores > edge for edge in edges], [-1, 2, 1, 0], default=-1)
+        leads_df['tier'] = pd.Categorical.from_codes(tier_codes, categories=['Tier 3', 'Tier 2', 'Tier 1'], ordered=True)
         
         # Add lead ID
-        leads_df['lead_id'] = [f"LEAD-{i:04d}" for i in range(1, len(leads_df) + 1)]
+        ids = np.char.zfill(np.arange(1, len(leads_df) + 1).astype(str), 4)
+        leads_df['lead_id'] = np.char.add('LEAD-', ids)
         
         # Select and reorder columns for dashboard
         dashboard_columns = [
@@ -208,173 +238,176 @@ class LeadScorer:
         
         return leads_df[existing_columns]
     
-    def _calculate_basic_relevance(self, company):
-        """Calculate a basic relevance score for a company
+    def _normalize_scores(self, scores):
+        """Scale scores to range 0-1 by their maximum and round them to 2 decimal places
         
         Args:
-            company (pandas.Series): Company information
+            scores (numpy.ndarray): Raw scores, modified in place
             
         Returns:
-            float: Relevance score between 0 and 1
+            numpy.ndarray: Normalized scores
         """
-        score = 0.5  # Default score
+        # Missing scores are ignored when finding the maximum, as Series.max() does
+        max_score = np.nanmax(scores, initial=0.0)
+        if max_score > 0:
+            scores /= max_score
         
-        # Check if industry is relevant
-        if 'industry' in company:
-            industry = str(company['industry']).lower()
-            if any(keyword in industry for keyword in ['sign', 'graphic', 'print', 'display', 'advertising']):
-                score += 0.3
-        
-        # Check if description mentions relevant keywords
-        if 'description' in company:
-            description = str(company['description']).lower()
-            relevant_keywords = ['sign', 'graphic', 'print', 'display', 'banner', 'billboard', 'exhibit', 'vinyl', 'pvc', 'film']
-            matches = sum(1 for keyword in relevant_keywords if keyword in description)
-            score += min(matches * 0.05, 0.2)  # Up to 0.2 points for relevant keywords
-        
-        return min(score, 1.0)  # Cap at 1.0
+        return np.round(scores, 2, out=scores)
     
-    def _calculate_size_score(self, company):
-        """Calculate score based on company size
+    def _calculate_basic_relevance_scores(self, companies_df):
+        """Calculate basic relevance scores for all companies
         
         Args:
-            company (pandas.Series): Company information
+            companies_df (pandas.DataFrame): DataFrame containing company information,
+                with the helper columns from _add_lowercase_columns
             
         Returns:
-            float: Size score between 0 and 1
+            numpy.ndarray: Relevance scores between 0 and 1
         """
-        if 'company_size' in company:
-            size = str(company['company_size']).lower()
-            
-            if size == 'large':
-                return 1.0
-            elif size == 'medium':
-                return 0.7
-            elif size == 'small':
-                return 0.4
-            elif size == 'micro':
-                return 0.2
-        
-        # If employees count is available
-        if 'employees' in company and company['employees']:
-            try:
-                employees = int(company['employees'])
-                
-                if employees >= 1000:
-                    return 1.0
-                elif employees >= 250:
-                    return 0.8
-                elif employees >= 50:
-                    return 0.6
-                elif employees >= 10:
-                    return 0.4
-                else:
-                    return 0.2
-            except (ValueError, TypeError):
-                pass
+        score = np.full(len(companies_df), 0.5)  # Default score
         
-        # Default score if no size information is available
-        return 0.5
+        # Check if industry is relevant
+        if '_industry_lc' in companies_df.columns:
+            industry = companies_df['_industry_lc']
+            score = score + np.where(industry.str.contains(self.relevant_industry_pattern), 0.3, 0.0)
+        
+        # Check if description mentions relevant keywords, up to 0.2 points
+        if '_description_lc' in companies_df.columns:
+            description = companies_df['_description_lc']
+            matches = sum(description.str.contains(pattern).to_numpy(dtype=int)
+                          for pattern in self.description_keyword_patterns)
+            score = score + np.minimum(matches * 0.05, 0.2)
+        
+        return np.minimum(score, 1.0)  # Cap at 1.0
     
-    def _calculate_industry_score(self, company):
-        """Calculate score based on industry relevance
+    def _calculate_size_scores(self, companies_df):
+        """Calculate scores based on company size for all companies
         
         Args:
-            company (pandas.Series): Company information
+            companies_df (pandas.DataFrame): DataFrame containing company information,
+                with the helper columns from _add_lowercase_columns
             
         Returns:
-            float: Industry score between 0 and 1
+            numpy.ndarray: Size scores between 0 and 1
         """
-        if 'industry' not in company:
-            return 0.5  # Default score
-        
-        industry = str(company['industry']).lower()
-        
-        # Highly relevant industries
-        if any(keyword in industry for keyword in ['sign', 'signage', 'display']):
-            return 1.0
+        # Missing until a size category or employees count is found
+        score = np.full(len(companies_df), np.nan)
+        
+        # Use the employees count where it is available
+        if 'employees' in companies_df.columns:
+            employees = pd.to_numeric(companies_df['employees'], errors='coerce').to_numpy(dtype=float)
+            employees = np.where(employees == 0, np.nan, employees)  # Zero counts as unknown
+            score = np.select(
+                [employees >= 1000, employees >= 250, employees >= 50, employees >= 10, ~np.isnan(employees)],
+                [1.0, 0.8, 0.6, 0.4, 0.2],
+                default=np.nan
+            )
+        
+        # A known size category takes precedence over the employees count
+        if '_company_size_lc' in companies_df.columns:
+            codes = companies_df['_company_size_lc'].cat.codes.to_numpy()
+            score = np.where(codes >= 0, self.company_size_scores[codes], score)
         
-        # Very relevant industries
-        if any(keyword in industry for keyword in ['graphic', 'print', 'advertising']):
-            return 0.8
+        # Default score if no size information is available
+        return np.where(np.isnan(score), 0.5, score)
+    
+    def _calculate_industry_scores(self, companies_df):
+        """Calculate scores based on industry relevance for all companies
         
-        # Somewhat relevant industries
-        if any(keyword in industry for keyword in ['marketing', 'media', 'visual', 'design', 'exhibition']):
-            return 0.6
+        Args:
+            companies_df (pandas.DataFrame): DataFrame containing company information,
+                with the helper columns from _add_lowercase_columns
+            
+        Returns:
+            numpy.ndarray: Industry scores between 0 and 1
+        """
+        if '_industry_lc' not in companies_df.columns:
+            return np.full(len(companies_df), 0.5)  # Default score
         
-        # Less relevant but still potential industries
-        if any(keyword in industry for keyword in ['manufacturing', 'production', 'retail', 'construction']):
-            return 0.4
+        industry = companies_df['_industry_lc']
         
-        # Not very relevant industries
-        return 0.2
+        # First matching tier wins; anything else is not very relevant
+        return np.select(
+            [industry.str.contains(pattern) for pattern, _ in self.industry_tier_patterns],
+            [score for _, score in self.industry_tier_patterns],
+            default=0.2
+        )
     
-    def _calculate_product_fit(self, company):
-        """Calculate score based on product fit for Tedlar
+    def _calculate_product_fit_scores(self, companies_df):
+        """Calculate scores based on product fit for Tedlar for all companies
         
         Args:
-            company (pandas.Series): Company information
+            companies_df (pandas.DataFrame): DataFrame containing company information
             
         Returns:
-            float: Product fit score between 0 and 1
+            numpy.ndarray: Product fit scores between 0 and 1
         """
-        score = 0.5  # Default score
+        # 0.1 points per relevant product, up to 0.3
+        product_matches = np.zeros(len(companies_df), dtype=np.uint8)
+        if 'products' in companies_df.columns:
+            product_matches = count_keyword_matches(
+                companies_df['products'], self.relevant_product_pattern, max_count=3)
+        
+        # 0.1 points per relevant material, until the score reaches 1.0
+        material_matches = np.zeros(len(companies_df), dtype=np.uint8)
+        if 'materials' in companies_df.columns:
+            material_matches = count_keyword_matches(
+                companies_df['materials'], self.relevant_material_pattern, max_count=5)
+        
+        # Default score of 0.5, capped at 1.0
+        return np.minimum(0.5 + 0.1 * product_matches + 0.1 * material_matches, 1.0)
+    
+    def _add_lowercase_columns(self, companies_df):
+        """Add lowercased copies of the text columns read by the scorers
         
-        # Check products
-        if 'products' in company and company['products']:
-            products = company['products']
-            if isinstance(products, str):
-                products = [products]
-            
-            relevant_products = ['sign', 'banner', 'display', 'billboard', 'graphic', 'wrap', 'exhibit']
-            for product in products:
-                product = str(product).lower()
-                if any(rp in product for rp in relevant_products):
-                    score += 0.1  # 0.1 points per relevant product, up to 0.3
-                    if score >= 0.8:
-                        break
-        
-        # Check materials
-        if 'materials' in company and company['materials']:
-            materials = company['materials']
-            if isinstance(materials, str):
-                materials = [materials]
+        Args:
+            companies_df (pandas.DataFrame): DataFrame containing company information
             
-            relevant_materials = ['vinyl', 'pvc', 'plastic', 'film', 'composite']
-            for material in materials:
-                material = str(material).lower()
-                if any(rm in material for rm in relevant_materials):
-                    score += 0.1  # 0.1 points per relevant material, up to 0.3
-                    if score >= 1.0:
-                        break
-        
-        return min(score, 1.0)  # Cap at 1.0
+        Returns:
+            pandas.DataFrame: DataFrame with `_<column>_lc` helper columns added
+        """
+        lowercase_columns = {
+            f'_{col}_lc': self._lowercase(companies_df[col])
+            for col in ['industry', 'description', 'company_size']
+            if col in companies_df.columns
+        }
+        
+        # Sizes outside the known categories become missing codes
+        if '_company_size_lc' in lowercase_columns:
+            size = lowercase_columns['_company_size_lc']
+            known_size = size.isin(self.company_size_dtype.categories)
+            lowercase_columns['_company_size_lc'] = size.where(known_size).astype(self.company_size_dtype)
+        return companies_df.assign(**lowercase_columns)
     
-    def _calculate_decision_power_from_title(self, stakeholder):
-        """Calculate decision making power based on job title
+    def _lowercase(self, values):
+        """Lowercase a column as strings, treating missing values as empty
         
         Args:
-            stakeholder (pandas.Series): Stakeholder information
+            values (pandas.Series): Column to lowercase
             
         Returns:
-            float: Decision making power score between 0 and 1
+            pandas.Series: Lowercased strings
         """
-        if 'title' not in stakeholder or not stakeholder['title']:
-            return 0.5  # Default score
-        
-        title = str(stakeholder['title']).lower()
-        
-        # Highest decision power for executive roles
-        if any(keyword in title for keyword in ['ceo', 'chief', 'president', 'owner', 'founder', 'managing director']):
-            return 1.0
+        return values.fillna('').astype(str).str.lower()
+    
+    def _calculate_decision_powers(self, stakeholders_df):
+        """Calculate decision making power based on job title for all stakeholders
         
-        # High decision power for director and VP roles
-        if any(keyword in title for keyword in ['director', 'vp', 'vice president', 'head']):
-            return 0.8
+        Args:
+            stakeholders_df (pandas.DataFrame): DataFrame containing stakeholder information
+            
+        Returns:
+            numpy.ndarray: Decision making power scores between 0 and 1
+        """
+        if 'title' not in stakeholders_df.columns:
+            return np.full(len(stakeholders_df), 0.5)  # Default score
         
-        # Medium decision power for manager roles
-        if any(keyword in title for keyword in ['manager', 'lead', 'senior', 'principal']):
-            return 0.6
+        title = self._lowercase(stakeholders_df['title'])
         
-        # Lower decision power for other roles
-        return 0.4
\ No newline at end of file
+        # Default score for missing titles; highest power for executives, then director/VP
+        # and manager roles, and lower decision power for other roles
+        return np.select(
+            [title == ''] + [title.str.contains(pattern) for pattern, _ in self.title_tier_patterns],
+            [0.5] + [score for _, score in self.title_tier_patterns],
+            default=0.4
+        )
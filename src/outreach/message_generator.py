@@ -6,10 +6,13 @@ for stakeholders at target companies.
 
 import os
 import logging
+import orjson
+import numpy as np
 import pandas as pd
-import openai
+from openai import OpenAI
 from pathlib import Path
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
 # Add project root to path
 project_root = Path(__file__).parent.parent.parent
@@ -18,9 +21,21 @@ sys.path.append(str(project_root))
 from src.config.config import (
     OUTPUT_DATA_DIR,
     OPENAI_API_KEY,
+    OPENAI_RATE_LIMIT,
+    OPENAI_CACHE_TTL,
+    OPENAI_MAX_RETRIES,
+    CACHE_DIR,
+    MAX_CONCURRENT_REQUESTS,
     TARGET_PRODUCT,
     TARGET_INDUSTRY
 )
+from src.utils.rate_limiter import RateLimiter
+from src.utils.cache import FileCache
+from src.utils.data_io import write_csv
+
+# Recipient placeholders in company-level AI messages
+_NAME_PLACEHOLDER = '<<NAME>>'
+_TITLE_PLACEHOLDER = '<<TITLE>>'
 
 
 class MessageGenerator:
@@ -28,18 +43,29 @@ class MessageGenerator:
     
     def __init__(self):
         """Initialize the MessageGenerator with OpenAI API key and settings"""
-        # Set OpenAI API key
-        openai.api_key = OPENAI_API_KEY
+        # OpenAI client, only available when an API key is configured; the client
+        # retries rate-limited (429) and server errors with exponential backoff,
+        # honoring the Retry-After header
+        self.client = OpenAI(api_key=OPENAI_API_KEY, max_retries=OPENAI_MAX_RETRIES) if OPENAI_API_KEY else None
+        self.model = "gpt-4o"
+        
+        # AI messages are requested in parallel, throttled to the OpenAI rate limit
+        self.max_workers = MAX_CONCURRENT_REQUESTS
+        self.openai_limiter = RateLimiter(OPENAI_RATE_LIMIT)
+        
+        # Generated messages are reused for identical prompts across runs
+        self.openai_cache = FileCache(CACHE_DIR / 'openai', OPENAI_CACHE_TTL)
         
         # Ensure output directory exists
         self.output_dir = OUTPUT_DATA_DIR
         self.output_dir.mkdir(parents=True, exist_ok=True)
         
-        # Setup logging
-        logging.basicConfig(level=logging.INFO, 
-                           format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+        # Setup logging; handlers and levels are configured by the entry-point scripts
         self.logger = logging.getLogger(__name__)
         
+        # Stakeholder columns used to select and personalize messages
+        self.stakeholder_columns = ['id', 'name', 'title', 'company', 'email', 'priority_score']
+        
         # Message templates
         self.templates = {
             'initial_outreach': {
@@ -95,128 +121,202 @@ DuPont Tedlar Graphics & Signage Team
             }
         }
     
-    def generate_messages(self, stakeholders_df, companies_df, events_df=None):
+    def generate_messages(self, stakeholders_df, companies_df, events_df=None, save=False):
         """Generate personalized outreach messages for stakeholders
         
         Args:
             stakeholders_df (pandas.DataFrame): DataFrame containing stakeholder information
             companies_df (pandas.DataFrame): DataFrame containing company information
             events_df (pandas.DataFrame, optional): DataFrame containing event information
+            save (bool): Whether to also save the messages to stakeholders_with_messages.csv
             
         Returns:
             pandas.DataFrame: DataFrame containing stakeholders with personalized messages
         """
         self.logger.info(f"Generating messages for {len(stakeholders_df)} stakeholders")
         
-        # Merge stakeholders with company information
-        stakeholders_with_companies = pd.merge(
-            stakeholders_df,
-            companies_df[['name', 'industry', 'description', 'products', 'target_markets']],
-            left_on='company',
-            right_on='name',
-            suffixes=('', '_company')
+        # Company names are the join key, so each stakeholder must match exactly one company
+        duplicated = companies_df['name'].duplicated(keep='last')
+        if duplicated.any():
+            self.logger.warning(f"Found {duplicated.sum()} duplicate company names, keeping the last entry for each")
+            companies_df = companies_df[~duplicated]
+        
+        # Both sides share one categorical dtype, so the join matches integer
+        # codes instead of hashing company name strings. Stakeholders of unknown
+        # companies get a missing code, so unnamed companies must not be joined.
+        companies_df = companies_df[companies_df['name'].notna()]
+        company_dtype = pd.CategoricalDtype(companies_df['name'])
+        
+        # Merge stakeholders with company information, formatting the
+        # product and application phrases once per company. Only the columns
+        # read while building messages are carried through the join.
+        companies_indexed = companies_df.set_index(companies_df['name'].astype(company_dtype))[['industry']].assign(
+            products_or_services=companies_df['products'].map(self._format_products).to_numpy(),
+            specific_application=companies_df['target_markets'].map(self._format_application).to_numpy()
+        )
+        stakeholder_columns = stakeholders_df.columns.intersection(self.stakeholder_columns, sort=False)
+        known_company = stakeholders_df['company'].isin(company_dtype.categories)
+        stakeholders_slim = stakeholders_df[stakeholder_columns].assign(
+            company=stakeholders_df['company'].where(known_company).astype(company_dtype)
+        )
+        stakeholders_with_companies = stakeholders_slim.join(
+            companies_indexed,
+            on='company',
+            how='inner',
+            validate='m:1'
         )
         
-        # Generate messages for each stakeholder
-        messages = []
+        # Event lookups are the same for every stakeholder, so prepare them once.
+        # The top event is only needed when a stakeholder gets the event template.
+        event_companies = self._get_event_companies(events_df)
+        template_types = self._select_template_types(stakeholders_with_companies, event_companies)
+        top_event = self._get_top_event(events_df) if 'event_based' in template_types else None
         
-        for _, stakeholder in stakeholders_with_companies.iterrows():
-            # Determine the best template based on stakeholder and company information
-            template_type = self._select_template_type(stakeholder, events_df)
-            
-            # Generate personalized message
-            message = self._generate_personalized_message(stakeholder, template_type, events_df)
-            
-            messages.append({
-                'stakeholder_id': stakeholder.get('id', ''),
-                'name': stakeholder['name'],
-                'company': stakeholder['company'],
-                'email': stakeholder.get('email', ''),
-                'template_type': template_type,
-                'subject': message['subject'],
-                'body': message['body']
-            })
+        # Build the template messages with list comprehensions over plain
+        # dict records, which avoids building a Series for every row
+        records = stakeholders_with_companies.to_dict('records')
+        message_vars = [
+            self._build_message_vars(stakeholder, template_type, top_event)
+            for stakeholder, template_type in zip(records, template_types)
+        ]
+        messages = [
+            self._generate_personalized_message(template_type, stakeholder_vars)
+            for template_type, stakeholder_vars in zip(template_types, message_vars)
+        ]
+        
+        # High-priority stakeholders get a custom AI message instead. The prompt only
+        # depends on the company, so one message is generated per company with
+        # placeholders for the recipient, which are filled in per stakeholder.
+        high_priority = []
+        if self.client and 'priority_score' in stakeholders_with_companies.columns:
+            high_priority = np.flatnonzero(stakeholders_with_companies['priority_score'].to_numpy() >= 0.9)
+        
+        ai_requests = {}
+        for position in high_priority:
+            company = message_vars[position]['company']
+            if company not in ai_requests:
+                ai_requests[company] = {
+                    **message_vars[position],
+                    'name': _NAME_PLACEHOLDER,
+                    'title': _TITLE_PLACEHOLDER
+                }
+        
+        # Replace template messages with the AI messages that were generated successfully
+        ai_messages = self._generate_ai_messages_concurrently(ai_requests)
+        for position in high_priority:
+            custom_message = ai_messages.get(message_vars[position]['company'])
+            if custom_message:
+                messages[position] = self._personalize_ai_message(custom_message, message_vars[position])
         
-        # Create DataFrame from messages
-        messages_df = pd.DataFrame(messages)
+        # Create DataFrame from messages, indexed by stakeholder for the join below
+        messages_df = (
+            stakeholders_with_companies.reindex(columns=['id', 'name', 'company', 'email'])
+            .rename(columns={'id': 'stakeholder_id'})
+            .assign(
+                template_type=template_types,
+                subject=[message['subject'] for message in messages],
+                body=[message['body'] for message in messages]
+            )
+        )
         
-        # Save messages to CSV
-        messages_df.to_csv(self.output_dir / 'stakeholders_with_messages.csv', index=False)
-        self.logger.info(f"Saved {len(messages_df)} messages to stakeholders_with_messages.csv")
+        if save:
+            write_csv(messages_df, self.output_dir / 'stakeholders_with_messages.csv')
+            self.logger.info(f"Saved {len(messages_df)} messages to stakeholders_with_messages.csv")
         
-        # Merge messages back with stakeholders DataFrame
-        stakeholders_with_messages = pd.merge(
-            stakeholders_df,
-            messages_df[['stakeholder_id', 'template_type', 'subject', 'body']],
-            left_on='id',
-            right_on='stakeholder_id',
-            how='left'
+        # Join messages back onto the stakeholders DataFrame
+        stakeholders_with_messages = stakeholders_df.join(
+            messages_df.set_index('stakeholder_id')[['template_type', 'subject', 'body']],
+            on='id',
+            how='left',
+            validate='1:1'
         )
         
         return stakeholders_with_messages
     
-    def _select_template_type(self, stakeholder, events_df):
-        """Select the best template type for a stakeholder
+    def _get_event_companies(self, events_df):
+        """Collect the lowercased names of all companies exhibiting at an event
+        
+        Args:
+            events_df (pandas.DataFrame): DataFrame containing event information
+            
+        Returns:
+            frozenset: Lowercased exhibitor names across all events
+        """
+        if events_df is None or events_df.empty or 'exhibitors' not in events_df.columns:
+            return frozenset()
+        
+        # This is a simplified check - in a real system, we would have a more sophisticated way
+        # to determine if a company is attending an event
+        return frozenset(
+            exhibitor.lower()
+            for exhibitors in events_df['exhibitors']
+            if isinstance(exhibitors, (list, tuple, set))
+            for exhibitor in exhibitors
+        )
+    
+    def _get_top_event(self, events_df):
+        """Get the event with the highest relevance score
         
         Args:
-            stakeholder (pandas.Series): Stakeholder information
             events_df (pandas.DataFrame): DataFrame containing event information
             
         Returns:
-            str: Template type ('initial_outreach', 'follow_up', or 'event_based')
+            pandas.Series: Top event, or None if there is no event information
         """
-        # If events data is available and the company is attending an event, use event-based template
-        if events_df is not None and not events_df.empty:
-            # This is a simplified check - in a real system, we would have a more sophisticated way
-            # to determine if a company is attending an event
-            company_name = stakeholder['company'].lower()
+        if events_df is None or events_df.empty:
+            return None
+        
+        # Events without a score rank last, so the first event is used when none are scored
+        if 'relevance_score' not in events_df.columns or events_df['relevance_score'].isna().all():
+            return events_df.iloc[0]
+        
+        # Positional lookup so a duplicated index cannot return several rows
+        return events_df.iloc[events_df['relevance_score'].reset_index(drop=True).idxmax()]
+    
+    def _select_template_types(self, stakeholders_df, event_companies):
+        """Select the best template type for each stakeholder
+        
+        Args:
+            stakeholders_df (pandas.DataFrame): DataFrame containing stakeholder information
+            event_companies (frozenset): Lowercased names of companies exhibiting at an event
             
-            for _, event in events_df.iterrows():
-                # Check if we have exhibitor information for this event
-                if 'exhibitors' in event and company_name in [e.lower() for e in event['exhibitors']]:
-                    return 'event_based'
+        Returns:
+            list: Template type ('initial_outreach', 'follow_up', or 'event_based') per stakeholder
+        """
+        # Companies attending an event get the event-based template
+        attending_event = stakeholders_df['company'].str.lower().isin(event_companies).to_numpy()
         
-        # For high-priority stakeholders, use initial outreach
-        if 'priority_score' in stakeholder and stakeholder['priority_score'] >= 0.7:
-            return 'initial_outreach'
+        # High-priority stakeholders get initial outreach
+        if 'priority_score' in stakeholders_df.columns:
+            high_priority = stakeholders_df['priority_score'].to_numpy() >= 0.7
+        else:
+            high_priority = np.zeros(len(stakeholders_df), dtype=bool)
         
         # Default to follow-up template
-        return 'follow_up'
+        return np.select(
+            [attending_event, high_priority],
+            ['event_based', 'initial_outreach'],
+            default='follow_up'
+        ).tolist()
     
-    def _generate_personalized_message(self, stakeholder, template_type, events_df):
-        """Generate a personalized message for a stakeholder using a template
+    def _build_message_vars(self, stakeholder, template_type, top_event):
+        """Build the variables used to personalize a message for a stakeholder
         
         Args:
-            stakeholder (pandas.Series): Stakeholder information
+            stakeholder (dict): Stakeholder information
             template_type (str): Template type ('initial_outreach', 'follow_up', or 'event_based')
-            events_df (pandas.DataFrame): DataFrame containing event information
+            top_event (pandas.Series): Event with the highest relevance score, or None
             
         Returns:
-            dict: Dictionary containing subject and body of the message
+            dict: Variables for message personalization
         """
-        template = self.templates[template_type]
-        
         # Extract relevant information for message personalization
         name = stakeholder['name']
         company = stakeholder['company']
         title = stakeholder.get('title', 'professional')
         industry = stakeholder.get('industry', TARGET_INDUSTRY)
-        
-        # Extract products or services from company information
-        products_or_services = 'products and services'
-        if 'products' in stakeholder and stakeholder['products']:
-            if isinstance(stakeholder['products'], list):
-                products_or_services = ', '.join(stakeholder['products'][:2])
-            else:
-                products_or_services = str(stakeholder['products'])
-        
-        # Determine specific application based on industry and products
-        specific_application = 'signage and graphics'
-        if 'target_markets' in stakeholder and stakeholder['target_markets']:
-            if isinstance(stakeholder['target_markets'], list):
-                specific_application = stakeholder['target_markets'][0]
-            else:
-                specific_application = str(stakeholder['target_markets'])
+        products_or_services = stakeholder.get('products_or_services', 'products and services')
+        specific_application = stakeholder.get('specific_application', 'signage and graphics')
         
         # Prepare message variables
         message_vars = {
@@ -231,40 +331,111 @@ DuPont Tedlar Graphics & Signage Team
         }
         
         # Add event information if using event-based template
-        if template_type == 'event_based' and events_df is not None and not events_df.empty:
-            # Use the highest relevance score event
-            event = events_df.sort_values('relevance_score', ascending=False).iloc[0]
-            
+        if template_type == 'event_based' and top_event is not None:
             message_vars.update({
-                'event_name': event['name'],
-                'event_location': event['location'],
-                'event_date': event['date']
+                'event_name': top_event['name'],
+                'event_location': top_event['location'],
+                'event_date': top_event['date']
             })
         
-        # Format subject and body with variables
-        subject = template['subject'].format(**message_vars)
-        body = template['body'].format(**message_vars)
+        return message_vars
+    
+    def _format_products(self, products):
+        """Format a company's products or services for a message
+        
+        Args:
+            products (list or str): Company products
+            
+        Returns:
+            str: The first two products, or a generic phrase if none are known
+        """
+        if not products:
+            return 'products and services'
+        
+        if isinstance(products, list):
+            return ', '.join(products[:2])
+        
+        return str(products)
+    
+    def _format_application(self, target_markets):
+        """Determine a company's specific application from its target markets
+        
+        Args:
+            target_markets (list or str): Company target markets
+            
+        Returns:
+            str: The first target market, or a generic application if none are known
+        """
+        if not target_markets:
+            return 'signage and graphics'
+        
+        if isinstance(target_markets, list):
+            return target_markets[0]
+        
+        return str(target_markets)
+    
+    def _generate_personalized_message(self, template_type, message_vars):
+        """Generate a personalized message for a stakeholder using a template
         
-        # For more sophisticated personalization, we could use OpenAI API
-        # to generate completely custom messages based on stakeholder information
-        if OPENAI_API_KEY and 'priority_score' in stakeholder and stakeholder['priority_score'] >= 0.9:
-            try:
-                custom_message = self._generate_ai_message(stakeholder, message_vars)
-                if custom_message:
-                    return custom_message
-            except Exception as e:
-                self.logger.error(f"Error generating AI message: {str(e)}")
+        Args:
+            template_type (str): Template type ('initial_outreach', 'follow_up', or 'event_based')
+            message_vars (dict): Variables for message personalization
+            
+        Returns:
+            dict: Dictionary containing subject and body of the message
+        """
+        template = self.templates[template_type]
         
+        # Format subject and body with variables; format_map reads the dict
+        # directly instead of unpacking it into keyword arguments
         return {
-            'subject': subject,
-            'body': body
+            'subject': template['subject'].format_map(message_vars),
+            'body': template['body'].format_map(message_vars)
+        }
+    
+    def _generate_ai_messages_concurrently(self, ai_requests):
+        """Generate several custom messages using OpenAI API in parallel
+        
+        Args:
+            ai_requests (dict): Mapping of a key to the variables for message personalization
+            
+        Returns:
+            dict: Mapping of each key to its generated message, or None if generation failed
+        """
+        if not ai_requests:
+            return {}
+        
+        self.logger.info(f"Generating {len(ai_requests)} AI messages")
+        
+        # The API calls are network-bound, so a bounded thread pool overlaps the waits
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {
+                key: executor.submit(self._generate_ai_message, message_vars)
+                for key, message_vars in ai_requests.items()
+            }
+            return {key: future.result() for key, future in futures.items()}
+    
+    def _personalize_ai_message(self, message, message_vars):
+        """Fill the recipient placeholders of a company-level AI message
+        
+        Args:
+            message (dict): Dictionary containing subject and body of the message
+            message_vars (dict): Variables for message personalization
+            
+        Returns:
+            dict: Dictionary containing the personalized subject and body
+        """
+        name = str(message_vars['name'])
+        title = str(message_vars['title'])
+        return {
+            key: text.replace(_NAME_PLACEHOLDER, name).replace(_TITLE_PLACEHOLDER, title)
+            for key, text in message.items()
         }
     
-    def _generate_ai_message(self, stakeholder, message_vars):
+    def _generate_ai_message(self, message_vars):
         """Generate a completely custom message using OpenAI API
         
         Args:
-            stakeholder (pandas.Series): Stakeholder information
             message_vars (dict): Variables for message personalization
             
         Returns:
@@ -288,45 +459,69 @@ Product Information:
 
 Generate a subject line and email body that is professional, concise, personalized, and compelling. Focus on how Tedlar can solve specific problems for this company based on their industry and applications.
 
+The recipient's name and title are placeholders. Wherever the name or title appears, write {_NAME_PLACEHOLDER} or {_TITLE_PLACEHOLDER} exactly as given.
+
 Format your response as JSON with 'subject' and 'body' fields.
 """
             
+            # Identical prompts produce interchangeable messages, so reuse a previous one
+            cache_key = f"{self.model}:{prompt}"
+            cached = self.openai_cache.get(cache_key)
+            if cached is not None:
+                self.logger.info(f"Using cached AI message for {message_vars['company']}")
+                return cached
+            
             # Call OpenAI API
-            response = openai.ChatCompletion.create(
-                model="gpt-4",
+            self.openai_limiter.acquire()
+            response = self.client.chat.completions.create(
+                model=self.model,
                 messages=[
-                    {"role": "system", "content": "You are a helpful assistant that generates personalized sales outreach emails."},
+                    {"role": "system", "content": "You are a helpful assistant that generates personalized sales outreach emails. "
+                                                  "Respond with a JSON object containing exactly two string fields: subject and body."},
                     {"role": "user", "content": prompt}
                 ],
                 temperature=0.7,
-                max_tokens=500
+                max_tokens=500,
+                response_format={"type": "json_object"}
             )
             
             # Extract message from response
-            message_text = response.choices[0].message.content
+            message = self._parse_ai_message(response.choices[0].message.content)
+            if message:
+                self.openai_cache.set(cache_key, message)
             
-            # Parse JSON response
-            import json
-            try:
-                message_json = json.loads(message_text)
-                return {
-                    'subject': message_json['subject'],
-                    'body': message_json['body']
-                }
-            except json.JSONDecodeError:
-                # If JSON parsing fails, extract subject and body using regex
-                import re
-                subject_match = re.search(r'Subject: (.+)', message_text)
-                body_match = re.search(r'Body: (.+)', message_text, re.DOTALL)
-                
-                if subject_match and body_match:
-                    return {
-                        'subject': subject_match.group(1).strip(),
-                        'body': body_match.group(1).strip()
-                    }
-                else:
-                    return None
+            return message
         
         except Exception as e:
             self.logger.error(f"Error in AI message generation: {str(e)}")
-            return None
\ No newline at end of file
+            return None
+    
+    def _parse_ai_message(self, message_text):
+        """Parse the subject and body out of an OpenAI API response
+        
+        Args:
+            message_text (str): Response content
+            
+        Returns:
+            dict: Dictionary containing subject and body of the message, or None if parsing fails
+        """
+        # JSON mode guarantees valid JSON, but not that both fields are present
+        try:
+            message_json = orjson.loads(message_text)
+        except orjson.JSONDecodeError:
+            self.logger.warning("AI message response was not valid JSON")
+            return None
+        
+        if not isinstance(message_json, dict):
+            return None
+        
+        subject = message_json.get('subject')
+        body = message_json.get('body')
+        if not isinstance(subject, str) or not isinstance(body, str):
+            self.logger.warning("AI message response is missing the subject or body")
+            return None
+        
+        return {
+            'subject': subject,
+            'body': body
+        }
@@ -0,0 +1,67 @@
+"""Cache Module for DuPont Tedlar Sales Lead Generation System
+
+This module provides a small on-disk key-value cache with expiry, used to
+avoid repeating paid API calls across pipeline runs.
+"""
+
+import hashlib
+import os
+import threading
+import time
+from pathlib import Path
+
+import orjson
+
+
+class FileCache:
+    """Directory-backed cache storing one JSON file per key"""
+    
+    def __init__(self, cache_dir, ttl):
+        """Initialize the FileCache
+        
+        Args:
+            cache_dir (str or Path): Directory holding the cache files
+            ttl (float): Number of seconds an entry stays valid
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.ttl = ttl
+    
+    def _path(self, key):
+        """Get the cache file path for a key"""
+        digest = hashlib.sha256(key.encode('utf-8')).hexdigest()
+        return self.cache_dir / f"{digest}.json"
+    
+    def get(self, key):
+        """Get a cached value
+        
+        Args:
+            key (str): Cache key
+            
+        Returns:
+            Any: Cached value, or None if missing, unreadable or expired
+        """
+        try:
+            entry = orjson.loads(self._path(key).read_bytes())
+        except (OSError, orjson.JSONDecodeError):
+            return None
+        
+        if entry.get('expires', 0) < time.time():
+            return None
+        
+        return entry.get('value')
+    
+    def set(self, key, value):
+        """Store a JSON-serializable value
+        
+        Args:
+            key (str): Cache key
+            value (Any): Value to cache
+        """
+        path = self._path(key)
+        entry = {'expires': time.time() + self.ttl, 'value': value}
+        
+        # Write to a temporary file first so concurrent readers never see a partial entry
+        tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp_path.write_bytes(orjson.dumps(entry))
+        os.replace(tmp_path, path)
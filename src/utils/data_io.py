@@ -0,0 +1,127 @@
+"""Data I/O Utilities for DuPont Tedlar Sales Lead Generation System
+
+This module provides shared helpers for reading and writing pipeline data files.
+"""
+
+import glob
+import re
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+from pyarrow import csv as pa_csv
+
+
+def _has_list_column(df):
+    """Check whether any object column holds Python lists
+    
+    Only the first non-null value of each object column is inspected.
+    
+    Args:
+        df (pandas.DataFrame): DataFrame to check
+        
+    Returns:
+        bool: True if a column starts with a list value
+    """
+    for col in df.columns[df.dtypes == object]:
+        values = df[col]
+        present = values.notna().to_numpy()
+        if present.any() and isinstance(values.iloc[present.argmax()], list):
+            return True
+    
+    return False
+
+
+def write_csv(df, path):
+    """Write a DataFrame to CSV using PyArrow's multi-threaded writer
+    
+    Frames with list columns, which PyArrow's CSV writer rejects, go straight
+    to pandas. Pandas is also the fallback for any other column PyArrow
+    cannot write.
+    
+    Args:
+        df (pandas.DataFrame): DataFrame to write
+        path (str or Path): Output file path
+    """
+    if _has_list_column(df):
+        df.to_csv(path, index=False)
+        return
+    
+    try:
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        pa_csv.write_csv(table, str(path), pa_csv.WriteOptions(quoting_style='needed'))
+    except pa.ArrowException:
+        df.to_csv(path, index=False)
+
+
+def write_parquet(df, path):
+    """Write a DataFrame to a zstd-compressed Parquet file
+    
+    Args:
+        df (pandas.DataFrame): DataFrame to write
+        path (str or Path): Output file path
+    """
+    df.to_parquet(path, index=False, engine='pyarrow', compression='zstd')
+
+
+def read_parquet(path):
+    """Read a Parquet file written by write_parquet
+    
+    List columns come back from Parquet as NumPy arrays; they are converted
+    back to Python lists so the pipeline sees the same values it wrote.
+    
+    Args:
+        path (str or Path): Input file path
+        
+    Returns:
+        pandas.DataFrame: DataFrame read from the file
+    """
+    df = pd.read_parquet(path, engine='pyarrow')
+    
+    for col in df.columns[df.dtypes == object]:
+        values = df[col]
+        if values.map(lambda value: isinstance(value, np.ndarray)).any():
+            df[col] = values.map(lambda value: value.tolist() if isinstance(value, np.ndarray) else value)
+    
+    return df
+
+
+def read_csv_cached(path, cache_dir):
+    """Read a CSV file, reusing a Parquet copy while the CSV is unchanged
+    
+    The Parquet copy is keyed by the CSV's size and modification time, so
+    editing or replacing the CSV invalidates it. Outdated copies of the same
+    CSV are removed when a new copy is written.
+    
+    Args:
+        path (str or Path): Input CSV file path
+        cache_dir (str or Path): Directory holding the Parquet copies
+        
+    Returns:
+        pandas.DataFrame: DataFrame read from the file
+    """
+    path = Path(path)
+    stat = path.stat()
+    cache_path = Path(cache_dir) / f"{path.stem}_{stat.st_size}_{stat.st_mtime_ns}.parquet"
+    
+    if cache_path.exists():
+        return read_parquet(cache_path)
+    
+    df = pd.read_csv(path)
+    
+    # Only names of the form {stem}_{size}_{mtime}, so CSVs whose stem starts
+    # with this one keep their copies
+    outdated = re.compile(rf"{re.escape(path.stem)}_\d+_\d+\.parquet")
+    for old_path in cache_path.parent.glob(f"{glob.escape(path.stem)}_*.parquet"):
+        if outdated.fullmatch(old_path.name):
+            old_path.unlink(missing_ok=True)
+    
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        write_parquet(df, cache_path)
+    except (ValueError, TypeError, pa.ArrowException):
+        # Columns Parquet cannot store are simply read from the CSV next time
+        cache_path.unlink(missing_ok=True)
+    
+    return df
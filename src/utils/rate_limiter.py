@@ -0,0 +1,42 @@
+"""Rate Limiter Module for DuPont Tedlar Sales Lead Generation System
+
+This module provides a thread-safe token bucket for keeping API calls
+under a provider's published request rate.
+"""
+
+import threading
+import time
+
+
+class RateLimiter:
+    """Token bucket allowing bursts of up to `max_rate` calls per `time_period`"""
+    
+    def __init__(self, max_rate, time_period=1.0):
+        """Initialize the RateLimiter with a full bucket
+        
+        Args:
+            max_rate (int): Maximum number of calls per time period
+            time_period (float): Length of the time period in seconds
+        """
+        self.capacity = max_rate
+        self.refill_rate = max_rate / time_period
+        self.tokens = float(max_rate)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+    
+    def acquire(self):
+        """Block until a call is allowed, then consume one token"""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.refill_rate)
+                self.updated = now
+                
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                
+                # Time until the next token becomes available
+                wait = (1 - self.tokens) / self.refill_rate
+            
+            time.sleep(wait)
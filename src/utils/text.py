@@ -0,0 +1,30 @@
+"""Text Utilities for DuPont Tedlar Sales Lead Generation System
+
+This module provides vectorized keyword matching shared by the company
+enricher and the lead scorer.
+"""
+
+import numpy as np
+import pandas as pd
+
+
+def count_keyword_matches(values, pattern, max_count=255):
+    """Count the list items in each row that match a keyword pattern
+
+    Items are lowercased before matching, with missing items treated as empty.
+
+    Args:
+        values (pandas.Series): Column holding a list of strings (or a single string) per row
+        pattern (str or re.Pattern): Regular expression of lowercase keywords
+        max_count (int): Count at which to stop counting, at most 255
+
+    Returns:
+        numpy.ndarray: Number of matching items per row as uint8
+    """
+    # Flatten to one item per row, keeping the positional row number as the index
+    items = pd.Series(values.to_numpy(), dtype=object).explode()
+    matches = items.fillna('').astype(str).str.lower().str.contains(pattern)
+
+    counts = matches.groupby(level=0).sum()
+    counts = counts.reindex(range(len(values)), fill_value=0).clip(upper=max_count)
+    return counts.to_numpy(dtype=np.uint8)
@@ -5,15 +5,19 @@ lead scoring results and provide insights for the sales team.
 """
 
 import os
+import hashlib
+import inspect
+import html
+import re
 import logging
 import pandas as pd
 import numpy as np
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
+import plotly
+import plotly.colors
+# plotly.express is slow to import, so the figure builders import it on a chart cache miss
+from plotly.offline import get_plotlyjs_version
 from pathlib import Path
 import sys
-import json
 
 # Add project root to path
 project_root = Path(__file__).parent.parent.parent
@@ -21,128 +25,108 @@ sys.path.append(str(project_root))
 
 from src.config.config import (
     OUTPUT_DATA_DIR,
+    CACHE_DIR,
     DASHBOARD_TITLE,
-    DASHBOARD_DESCRIPTION
+    DASHBOARD_DESCRIPTION,
+    DASHBOARD_CHART_CACHE_TTL,
+    DASHBOARD_MAX_ROWS,
+    DASHBOARD_MAX_SCATTER_POINTS
 )
+from src.utils.cache import FileCache
+from src.utils.data_io import write_csv
 
 
-class DashboardGenerator:
-    """Class for generating interactive dashboards to visualize lead scoring results"""
-    
-    def __init__(self):
-        """Initialize the DashboardGenerator with default settings"""
-        # Ensure output directories exist
-        self.output_dir = OUTPUT_DATA_DIR
-        self.dashboard_dir = self.output_dir / 'dashboard'
-        self.dashboard_dir.mkdir(parents=True, exist_ok=True)
-        
-        # Setup logging
-        logging.basicConfig(level=logging.INFO, 
-                           format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-        self.logger = logging.getLogger(__name__)
-        
-        # Dashboard settings
-        self.title = DASHBOARD_TITLE
-        self.description = DASHBOARD_DESCRIPTION
-        self.color_scale = px.colors.sequential.Viridis
-    
-    def generate_dashboard(self, leads_df, companies_df=None, stakeholders_df=None):
-        """Generate an interactive dashboard to visualize lead scoring results
-        
-        Args:
-            leads_df (pandas.DataFrame): DataFrame containing lead information
-            companies_df (pandas.DataFrame, optional): DataFrame containing company information
-            stakeholders_df (pandas.DataFrame, optional): DataFrame containing stakeholder information
-            
-        Returns:
-            str: Path to the generated dashboard HTML file
-        """
-        self.logger.info("Generating interactive dashboard")
-        
-        # Create HTML content
-        html_content = self._create_dashboard_html(leads_df, companies_df, stakeholders_df)
-        
-        # Save dashboard HTML file
-        dashboard_path = self.output_dir / 'dashboard.html'
-        with open(dashboard_path, 'w', encoding='utf-8') as f:
-            f.write(html_content)
-        
-        self.logger.info(f"Dashboard saved to {dashboard_path}")
-        
-        return str(dashboard_path)
-    
-    def _create_dashboard_html(self, leads_df, companies_df=None, stakeholders_df=None):
-        """Create HTML content for the dashboard
-        
-        Args:
-            leads_df (pandas.DataFrame): DataFrame containing lead information
-            companies_df (pandas.DataFrame, optional): DataFrame containing company information
-            stakeholders_df (pandas.DataFrame, optional): DataFrame containing stakeholder information
-            
-        Returns:
-            str: HTML content for the dashboard
-        """
-        # Create dashboard components
-        lead_table = self._create_lead_table(leads_df)
-        lead_charts = self._create_lead_charts(leads_df)
-        company_charts = self._create_company_charts(companies_df if companies_df is not None else leads_df)
-        stakeholder_charts = self._create_stakeholder_charts(stakeholders_df if stakeholders_df is not None else leads_df)
-        
-        # Combine components into a complete HTML document
-        html_content = f"""
+# Page styles and scripts, written next to the dashboard so browsers can cache them
+_DASHBOARD_CSS = """body {font-family: Arial, sans-serif; margin: 0; padding: 0; background-color: #f5f5f5;}
+.container {max-width: 1200px; margin: 0 auto; padding: 20px;}
+.header {background-color: #1a237e; color: white; padding: 20px; text-align: center; margin-bottom: 20px;}
+.dashboard-section {background-color: white; padding: 20px; margin-bottom: 20px; border-radius: 5px; box-shadow: 0 2px 5px rgba(0,0,0,0.1);}
+.chart-container {width: 100%; height: 400px; margin-bottom: 20px;}
+.chart-row {display: flex; flex-wrap: wrap; justify-content: space-between;}
+.chart-half {width: 48%; margin-bottom: 20px;}
+h1, h2, h3 {color: #1a237e;}
+.tier-1 {background-color: #c8e6c9; color: #2e7d32;}
+.tier-2 {background-color: #fff9c4; color: #f9a825;}
+.tier-3 {background-color: #ffcdd2; color: #c62828;}
+.dataTables_wrapper {margin-bottom: 30px;}
+table.dataTable thead th {background-color: #e8eaf6; color: #1a237e;}
+@media (max-width: 768px) {.chart-half {width: 100%;}}
+
+/* Styles for expandable cells */
+.expandable-cell {position: relative;}
+.preview-text {color: #555;}
+.expand-btn {cursor: pointer; color: #1a237e; text-decoration: underline; margin-top: 5px; font-size: 0.9em;}
+.full-text {margin-top: 5px; padding: 10px; background-color: #f9f9f9; border-radius: 4px; border-left: 3px solid #1a237e;}
+
+/* Qualification details styling */
+.qualification-section {margin-bottom: 8px;}
+.qualification-section h4 {margin: 5px 0; color: #1a237e; font-size: 0.9em;}
+.qualification-section p {margin: 3px 0; font-size: 0.9em;}
+
+/* Outreach message styling */
+.outreach-message {font-style: italic; color: #333;}
+.decision-maker-info {margin-bottom: 8px; font-weight: bold;}
+"""
+
+_DASHBOARD_JS = """$(document).ready(function() {
+    $('#leads-table').DataTable({
+        pageLength: 10,
+        order: [[2, 'desc']],
+        columnDefs: [
+            {targets: 3, render: function(data, type, row) {
+                if (data === 'Tier 1') return '<span class="tier-1">Tier 1</span>';
+                if (data === 'Tier 2') return '<span class="tier-2">Tier 2</span>';
+                if (data === 'Tier 3') return '<span class="tier-3">Tier 3</span>';
+                return data;
+            }}
+        ]
+    });
+
+    // Add event listeners for expandable cells
+    $(document).on('click', '.expand-btn', function() {
+        var fullText = $(this).siblings('.full-text');
+        var previewText = $(this).siblings('.preview-text');
+
+        if (fullText.is(':visible')) {
+            fullText.hide();
+            previewText.show();
+            $(this).text('Show More');
+        } else {
+            fullText.show();
+            previewText.hide();
+            $(this).text('Show Less');
+        }
+    });
+});
+"""
+
+# Page skeleton for the dashboard, split around the streamed lead table
+_DASHBOARD_HTML_HEAD_TEMPLATE = """
         <!DOCTYPE html>
         <html lang="en">
         <head>
             <meta charset="UTF-8">
             <meta name="viewport" content="width=device-width, initial-scale=1.0">
-            <title>{self.title}</title>
-            <script src="https://cdn.plot.ly/plotly-latest.min.js"></script>
+            <title>{title}</title>
+            <script src="https://cdn.plot.ly/plotly-{plotlyjs_version}.min.js"></script>
             <script src="https://code.jquery.com/jquery-3.6.0.min.js"></script>
             <script src="https://cdn.datatables.net/1.11.5/js/jquery.dataTables.min.js"></script>
             <link rel="stylesheet" href="https://cdn.datatables.net/1.11.5/css/jquery.dataTables.min.css">
-            <style>
-                body {{font-family: Arial, sans-serif; margin: 0; padding: 0; background-color: #f5f5f5;}}
-                .container {{max-width: 1200px; margin: 0 auto; padding: 20px;}}
-                .header {{background-color: #1a237e; color: white; padding: 20px; text-align: center; margin-bottom: 20px;}}
-                .dashboard-section {{background-color: white; padding: 20px; margin-bottom: 20px; border-radius: 5px; box-shadow: 0 2px 5px rgba(0,0,0,0.1);}}
-                .chart-container {{width: 100%; height: 400px; margin-bottom: 20px;}}
-                .chart-row {{display: flex; flex-wrap: wrap; justify-content: space-between;}}
-                .chart-half {{width: 48%; margin-bottom: 20px;}}
-                h1, h2, h3 {{color: #1a237e;}}
-                .tier-1 {{background-color: #c8e6c9; color: #2e7d32;}}
-                .tier-2 {{background-color: #fff9c4; color: #f9a825;}}
-                .tier-3 {{background-color: #ffcdd2; color: #c62828;}}
-                .dataTables_wrapper {{margin-bottom: 30px;}}
-                table.dataTable thead th {{background-color: #e8eaf6; color: #1a237e;}}
-                @media (max-width: 768px) {{.chart-half {{width: 100%;}}}}
-                
-                /* Styles for expandable cells */
-                .expandable-cell {{position: relative;}}
-                .preview-text {{color: #555;}}
-                .expand-btn {{cursor: pointer; color: #1a237e; text-decoration: underline; margin-top: 5px; font-size: 0.9em;}}
-                .full-text {{margin-top: 5px; padding: 10px; background-color: #f9f9f9; border-radius: 4px; border-left: 3px solid #1a237e;}}
-                
-                /* Qualification details styling */
-                .qualification-section {{margin-bottom: 8px;}}
-                .qualification-section h4 {{margin: 5px 0; color: #1a237e; font-size: 0.9em;}}
-                .qualification-section p {{margin: 3px 0; font-size: 0.9em;}}
-                
-                /* Outreach message styling */
-                .outreach-message {{font-style: italic; color: #333;}}
-                .decision-maker-info {{margin-bottom: 8px; font-weight: bold;}}
-            </style>
+            <link rel="stylesheet" href="{assets_dir}/dashboard.css">
         </head>
         <body>
             <div class="header">
-                <h1>{self.title}</h1>
-                <p>{self.description}</p>
+                <h1>{title}</h1>
+                <p>{description}</p>
             </div>
             
             <div class="container">
                 <div class="dashboard-section">
                     <h2>Lead Prioritization</h2>
                     <p>Below are the prioritized leads for DuPont Tedlar's Graphics & Signage team, ranked by lead score.</p>
-                    {lead_table}
+                    """
+
+_DASHBOARD_HTML_FOOT_TEMPLATE = """
                 </div>
                 
                 <div class="dashboard-section">
@@ -167,52 +151,165 @@ class DashboardGenerator:
                 </div>
             </div>
             
-            <script>
-                $(document).ready(function() {{                    
-                    $('#leads-table').DataTable({{                        
-                        pageLength: 10,
-                        order: [[2, 'desc']],
-                        columnDefs: [
-                            {{targets: 3, render: function(data, type, row) {{
-                                if (data === 'Tier 1') return '<span class="tier-1">Tier 1</span>';
-                                if (data === 'Tier 2') return '<span class="tier-2">Tier 2</span>';
-                                if (data === 'Tier 3') return '<span class="tier-3">Tier 3</span>';
-                                return data;
-                            }}}}
-                        ]
-                    }});
-                    
-                    // Add event listeners for expandable cells
-                    $(document).on('click', '.expand-btn', function() {{
-                        var fullText = $(this).siblings('.full-text');
-                        var previewText = $(this).siblings('.preview-text');
-                        
-                        if (fullText.is(':visible')) {{
-                            fullText.hide();
-                            previewText.show();
-                            $(this).text('Show More');
-                        }} else {{
-                            fullText.show();
-                            previewText.hide();
-                            $(this).text('Show Less');
-                        }}
-                    }});
-                }});
-            </script>
+            <script src="{assets_dir}/dashboard.js"></script>
         </body>
         </html>
         """
+
+_LEAD_TABLE_HEAD_TEMPLATE = """
+        <table id="leads-table" class="display" style="width:100%">
+            <thead>
+                <tr>
+                    {header_cells}
+                </tr>
+            </thead>
+            <tbody>
+                """
+
+_LEAD_TABLE_FOOT = """
+            </tbody>
+        </table>
+        """
+
+# Title keywords for each job level, checked in order
+_JOB_LEVEL_PATTERNS = {
+    'Executive': re.compile('ceo|chief|president|owner|founder'),
+    'Director/VP': re.compile('director|vp|vice president|head'),
+    'Manager': re.compile('manager|lead|senior')
+}
+
+# Table columns shown as a preview with a "Show More" toggle
+_EXPANDABLE_COLUMNS = ('Qualification Rationale', 'Personalized Outreach')
+
+
+# Markup of an expandable cell, split around the preview and the full text
+_EXPANDABLE_CELL_OPEN, _EXPANDABLE_CELL_MIDDLE, _EXPANDABLE_CELL_CLOSE = '''
+                    <td>
+                        <div class="expandable-cell">
+                            <div class="preview-text">{}...</div>
+                            <div class="expand-btn">Show More</div>
+                            <div class="full-text" style="display:none">{}</div>
+                        </div>
+                    </td>
+                    '''.split('{}')
+
+
+class DashboardGenerator:
+    """Class for generating interactive dashboards to visualize lead scoring results"""
+    
+    def __init__(self):
+        """Initialize the DashboardGenerator with default settings"""
+        # Ensure output directories exist
+        self.output_dir = OUTPUT_DATA_DIR
+        self.dashboard_dir = self.output_dir / 'dashboard'
+        self.dashboard_dir.mkdir(parents=True, exist_ok=True)
         
-        return html_content
+        # Setup logging; handlers and levels are configured by the entry-point scripts
+        self.logger = logging.getLogger(__name__)
+        
+        # Dashboard settings
+        self.max_rows = DASHBOARD_MAX_ROWS
+        self.max_scatter_points = DASHBOARD_MAX_SCATTER_POINTS
+        self.title = DASHBOARD_TITLE
+        self.description = DASHBOARD_DESCRIPTION
+        self.color_scale = plotly.colors.sequential.Viridis
+        
+        # Rendered chart HTML is reused while the charted data is unchanged
+        self.chart_cache = FileCache(CACHE_DIR / 'dashboard', DASHBOARD_CHART_CACHE_TTL)
+    
+    def generate_dashboard(self, leads_df, companies_df=None, stakeholders_df=None):
+        """Generate an interactive dashboard to visualize lead scoring results
+        
+        Args:
+            leads_df (pandas.DataFrame): DataFrame containing lead information
+            companies_df (pandas.DataFrame, optional): DataFrame containing company information
+            stakeholders_df (pandas.DataFrame, optional): DataFrame containing stakeholder information
+            
+        Returns:
+            str: Path to the generated dashboard HTML file
+        """
+        self.logger.info("Generating interactive dashboard")
+        
+        self._write_static_assets()
+        
+        # Stream the dashboard HTML to disk section by section
+        dashboard_path = self.output_dir / 'dashboard.html'
+        with open(dashboard_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+            self._write_dashboard_html(f, leads_df, companies_df, stakeholders_df)
+        
+        self.logger.info(f"Dashboard saved to {dashboard_path}")
+        
+        return str(dashboard_path)
     
-    def _create_lead_table(self, leads_df):
-        """Create an HTML table for leads
+    def _write_dashboard_html(self, f, leads_df, companies_df=None, stakeholders_df=None):
+        """Write the HTML content for the dashboard
         
         Args:
+            f (file object): Text file to write the HTML to
             leads_df (pandas.DataFrame): DataFrame containing lead information
+            companies_df (pandas.DataFrame, optional): DataFrame containing company information
+            stakeholders_df (pandas.DataFrame, optional): DataFrame containing stakeholder information
+        """
+        # Create dashboard components
+        # Chart helpers only receive the columns they plot
+        company_source = companies_df if companies_df is not None else leads_df
+        stakeholder_source = stakeholders_df if stakeholders_df is not None else leads_df
+        
+        chart_sections = {
+            'lead_charts': (self._create_lead_charts, leads_df, ['tier', 'lead_score']),
+            'company_charts': (self._create_company_charts, company_source, ['industry', 'company_size']),
+            'stakeholder_charts': (
+                self._create_stakeholder_charts,
+                stakeholder_source,
+                ['decision_making_power', 'company_score', 'lead_score', 'name', 'company', 'title']
+            )
+        }
+        
+        charts = {
+            section: create_charts(self._select_columns(source, columns))
+            for section, (create_charts, source, columns) in chart_sections.items()
+        }
+        
+        # Charts are small, so they are rendered up front; the lead table rows are
+        # written one at a time
+        assets_dir = Path(os.path.relpath(self.dashboard_dir, self.output_dir)).as_posix()
+        f.write(_DASHBOARD_HTML_HEAD_TEMPLATE.format(
+            title=self.title,
+            description=self.description,
+            plotlyjs_version=get_plotlyjs_version(),
+            assets_dir=assets_dir
+        ))
+        self._write_lead_table(f, leads_df)
+        f.write(_DASHBOARD_HTML_FOOT_TEMPLATE.format(assets_dir=assets_dir, **charts))
+    
+    def _write_static_assets(self):
+        """Write the dashboard stylesheet and script unless they are already up to date"""
+        self.dashboard_dir.mkdir(parents=True, exist_ok=True)
+        
+        for filename, content in [('dashboard.css', _DASHBOARD_CSS), ('dashboard.js', _DASHBOARD_JS)]:
+            path = self.dashboard_dir / filename
+            # Leaving unchanged files alone keeps their browser cache valid
+            if not path.exists() or path.read_text(encoding='utf-8') != content:
+                path.write_text(content, encoding='utf-8')
+    
+    def _select_columns(self, df, columns):
+        """Select the given columns that exist in a DataFrame
+        
+        Args:
+            df (pandas.DataFrame): DataFrame to select from
+            columns (list): Column names, in the order to select them
             
         Returns:
-            str: HTML table for leads
+            pandas.DataFrame: DataFrame with only the existing columns
+        """
+        return df[[col for col in columns if col in df.columns]]
+    
+    def _write_lead_table(self, f, leads_df):
+        """Write an HTML table for leads
+        
+        Args:
+            f (file object): Text file to write the HTML to
+            leads_df (pandas.DataFrame): DataFrame containing lead information
         """
         # Select and rename columns for the table
         table_columns = {
@@ -231,62 +328,133 @@ class DashboardGenerator:
         # Filter columns that exist in the DataFrame
         existing_columns = [col for col in table_columns.keys() if col in leads_df.columns]
         
-        # Create a copy with only the selected columns
-        table_df = leads_df[existing_columns].copy()
+        # Only the top leads are put in the page; the full list is linked as CSV
+        if len(leads_df) > self.max_rows:
+            full_path = self.output_dir / 'leads_full.csv'
+            write_csv(leads_df, full_path)
+            f.write(f'<p><a href="{full_path.name}" download>Download all {len(leads_df)} leads (CSV)</a></p>')
+            
+            if 'lead_score' in leads_df.columns:
+                leads_df = leads_df.nlargest(self.max_rows, 'lead_score')
+            else:
+                leads_df = leads_df.head(self.max_rows)
         
-        # Rename columns
-        table_df.columns = [table_columns[col] for col in existing_columns]
+        # Select and rename the columns without an extra copy of the selection
+        table_df = leads_df[existing_columns].rename(columns=table_columns)
         
-        # Convert DataFrame to HTML table
-        html_table = f"""
-        <table id="leads-table" class="display" style="width:100%">
-            <thead>
-                <tr>
-                    {' '.join(f'<th>{col}</th>' for col in table_df.columns)}
-                </tr>
-            </thead>
-            <tbody>
-                {self._df_to_table_rows(table_df)}
-            </tbody>
-        </table>
+        # Write DataFrame as an HTML table
+        f.write(_LEAD_TABLE_HEAD_TEMPLATE.format(
+            header_cells=' '.join(f'<th>{col}</th>' for col in table_df.columns)
+        ))
+        self._write_table_rows(f, table_df)
+        f.write(_LEAD_TABLE_FOOT)
+    
+    def _write_table_rows(self, f, df):
+        """Write DataFrame as HTML table rows with expandable details for qualification rationale and outreach
+        
+        Args:
+            f (file object): Text file to write the rows to
+            df (pandas.DataFrame): DataFrame to convert
         """
+        # Rows are assembled column by column with NumPy object-array concatenation,
+        # so the per-cell string building runs in NumPy's loop rather than in Python
+        rows = np.full(len(df), '<tr>', dtype=object)
+        
+        for col in df.columns:
+            values = df[col]
+            text = self._to_text(values if pd.api.types.is_numeric_dtype(values) else self._escape_html(values))
+            cells = '<td>' + text + '</td>'
+            
+            if col in _EXPANDABLE_COLUMNS:
+                # Previews are sliced from the raw text, so no escape sequence is cut in half
+                previews = self._to_text(self._escape_html(values.astype(str).str.slice(0, 50)))
+                expanded = _EXPANDABLE_CELL_OPEN + previews + _EXPANDABLE_CELL_MIDDLE + text + _EXPANDABLE_CELL_CLOSE
+                cells = np.where(values.to_numpy(dtype=object).astype(bool), expanded, cells)
+            
+            rows = rows + cells
         
-        return html_table
+        f.writelines(rows + '</tr>\n')
     
-    def _df_to_table_rows(self, df):
-        """Convert DataFrame to HTML table rows with expandable details for qualification rationale and outreach
+    def _to_text(self, values):
+        """Convert a column to an object array of the values' str() text
         
         Args:
-            df (pandas.DataFrame): DataFrame to convert
+            values (pandas.Series): Values to convert
             
         Returns:
-            str: HTML table rows
+            numpy.ndarray: Text of each value
         """
-        rows = []
-        for _, row in df.iterrows():
-            cells = []
+        # NumPy prints the shortest text of each float type, so a float32 0.81
+        # stays 0.81 instead of the 0.8100000023841858 of its Python float
+        if isinstance(values.dtype, np.dtype) and values.dtype.kind == 'f':
+            return values.to_numpy().astype(str).astype(object)
+        
+        return values.to_numpy(dtype=object).astype(str).astype(object)
+    
+    def _widen_float32(self, data):
+        """Convert float32 columns to float64, keeping the shortest text of each value
+        
+        Plotly would otherwise show float32 values such as 0.81 as 0.8100000023841858.
+        
+        Args:
+            data (pandas.DataFrame): Chart data
             
-            for i, value in enumerate(row.values):
-                col_name = df.columns[i]
-                
-                # Handle qualification rationale and personalized outreach with expandable sections
-                if col_name in ['Qualification Rationale', 'Personalized Outreach'] and value:
-                    # Create expandable content for longer text
-                    cells.append(f'''
-                    <td>
-                        <div class="expandable-cell">
-                            <div class="preview-text">{str(value)[:50]}...</div>
-                            <div class="expand-btn">Show More</div>
-                            <div class="full-text" style="display:none">{value}</div>
-                        </div>
-                    </td>
-                    ''')
-                else:
-                    cells.append(f'<td>{value}</td>')
-                    
-            rows.append(f'<tr>{"".join(cells)}</tr>')
+        Returns:
+            pandas.DataFrame: Chart data without float32 columns
+        """
+        float32_columns = data.columns[data.dtypes == np.float32]
+        if float32_columns.empty:
+            return data
+        
+        return data.assign(**{
+            col: data[col].to_numpy().astype(str).astype(np.float64) for col in float32_columns
+        })
+    
+    def _escape_html(self, values):
+        """Escape a column of values for use as HTML text, leaving missing values as they are
+        
+        Args:
+            values (pandas.Series): Values to escape
+            
+        Returns:
+            pandas.Series: Escaped values
+        """
+        return values.map(lambda value: html.escape(str(value)), na_action='ignore')
+    
+    def _render_chart(self, name, data, build_figure):
+        """Render a chart to HTML, reusing the cached HTML if the data is unchanged
         
-        return '\n'.join(rows)
+        Args:
+            name (str): Chart name
+            data (pandas.DataFrame): Data shown in the chart
+            build_figure (callable): Function building the plotly figure from the data
+            
+        Returns:
+            str: HTML content for the chart
+        """
+        data = self._widen_float32(data)
+        
+        # Titles, colours and chart types live in the figure builder, so its source is
+        # part of the key; without the source there is nothing to key on, so the chart
+        # is rendered uncached
+        try:
+            builder_source = inspect.getsource(build_figure)
+        except (OSError, TypeError):
+            return build_figure(data).to_html(full_html=False, include_plotlyjs=False)
+        builder_hash = hashlib.sha256(builder_source.encode('utf-8')).hexdigest()
+        
+        # The fingerprint covers the chart, the plotly version, the columns and every
+        # value in order, since row order decides the order of bars and slices
+        row_hashes = pd.util.hash_pandas_object(data, index=False).to_numpy()
+        fingerprint = hashlib.sha256(row_hashes.tobytes()).hexdigest()
+        cache_key = f"{name}:{plotly.__version__}:{builder_hash}:{list(data.columns)}:{fingerprint}"
+        
+        chart = self.chart_cache.get(cache_key)
+        if chart is None:
+            chart = build_figure(data).to_html(full_html=False, include_plotlyjs=False)
+            self.chart_cache.set(cache_key, chart)
+        
+        return chart
     
     def _create_lead_charts(self, leads_df):
         """Create charts for lead overview
@@ -302,34 +470,44 @@ class DashboardGenerator:
             tier_counts = leads_df['tier'].value_counts().reset_index()
             tier_counts.columns = ['Tier', 'Count']
             
-            tier_fig = px.pie(
-                tier_counts, 
-                values='Count', 
-                names='Tier', 
-                title='Lead Distribution by Tier',
-                color='Tier',
-                color_discrete_map={
-                    'Tier 1': '#4caf50',
-                    'Tier 2': '#ffeb3b',
-                    'Tier 3': '#f44336'
-                }
-            )
-            tier_fig.update_traces(textposition='inside', textinfo='percent+label')
-            tier_chart = tier_fig.to_html(full_html=False, include_plotlyjs=False)
+            def build_tier_figure(data):
+                import plotly.express as px
+                
+                tier_fig = px.pie(
+                    data, 
+                    values='Count', 
+                    names='Tier', 
+                    title='Lead Distribution by Tier',
+                    color='Tier',
+                    color_discrete_map={
+                        'Tier 1': '#4caf50',
+                        'Tier 2': '#ffeb3b',
+                        'Tier 3': '#f44336'
+                    }
+                )
+                tier_fig.update_traces(textposition='inside', textinfo='percent+label')
+                return tier_fig
+            
+            tier_chart = self._render_chart('tier_distribution', tier_counts, build_tier_figure)
         else:
             tier_chart = "<p>No tier data available</p>"
         
         # Create lead score distribution chart
         if 'lead_score' in leads_df.columns:
-            score_fig = px.histogram(
-                leads_df, 
-                x='lead_score', 
-                nbins=10,
-                title='Lead Score Distribution',
-                color_discrete_sequence=[self.color_scale[3]]
-            )
-            score_fig.update_layout(xaxis_title='Lead Score', yaxis_title='Number of Leads')
-            score_chart = score_fig.to_html(full_html=False, include_plotlyjs=False)
+            def build_score_figure(data):
+                import plotly.express as px
+                
+                score_fig = px.histogram(
+                    data, 
+                    x='lead_score', 
+                    nbins=10,
+                    title='Lead Score Distribution',
+                    color_discrete_sequence=[self.color_scale[3]]
+                )
+                score_fig.update_layout(xaxis_title='Lead Score', yaxis_title='Number of Leads')
+                return score_fig
+            
+            score_chart = self._render_chart('lead_score_distribution', leads_df[['lead_score']], build_score_figure)
         else:
             score_chart = "<p>No lead score data available</p>"
         
@@ -356,25 +534,32 @@ class DashboardGenerator:
         """
         # Create industry distribution chart
         if 'industry' in df.columns:
-            industry_counts = df['industry'].value_counts().reset_index()
-            industry_counts.columns = ['Industry', 'Count']
+            industry_counts = df['industry'].value_counts()
             
             # Limit to top 10 industries for readability
             if len(industry_counts) > 10:
-                other_count = industry_counts.iloc[10:]['Count'].sum()
-                industry_counts = industry_counts.iloc[:10]
-                industry_counts = pd.concat([industry_counts, pd.DataFrame([{'Industry': 'Other', 'Count': other_count}])])
+                industry_counts = pd.concat([
+                    industry_counts.iloc[:10],
+                    pd.Series({'Other': industry_counts.iloc[10:].sum()})
+                ])
             
-            industry_fig = px.bar(
-                industry_counts, 
-                x='Industry', 
-                y='Count', 
-                title='Companies by Industry',
-                color='Count',
-                color_continuous_scale=self.color_scale
-            )
-            industry_fig.update_layout(xaxis_title='Industry', yaxis_title='Number of Companies')
-            industry_chart = industry_fig.to_html(full_html=False, include_plotlyjs=False)
+            industry_counts = industry_counts.rename_axis('Industry').reset_index(name='Count')
+            
+            def build_industry_figure(data):
+                import plotly.express as px
+                
+                industry_fig = px.bar(
+                    data, 
+                    x='Industry', 
+                    y='Count', 
+                    title='Companies by Industry',
+                    color='Count',
+                    color_continuous_scale=self.color_scale
+                )
+                industry_fig.update_layout(xaxis_title='Industry', yaxis_title='Number of Companies')
+                return industry_fig
+            
+            industry_chart = self._render_chart('industry_distribution', industry_counts, build_industry_figure)
         else:
             industry_chart = "<p>No industry data available</p>"
         
@@ -383,16 +568,21 @@ class DashboardGenerator:
             size_counts = df['company_size'].value_counts().reset_index()
             size_counts.columns = ['Company Size', 'Count']
             
-            size_fig = px.pie(
-                size_counts, 
-                values='Count', 
-                names='Company Size', 
-                title='Companies by Size',
-                color='Company Size',
-                color_discrete_sequence=self.color_scale
-            )
-            size_fig.update_traces(textposition='inside', textinfo='percent+label')
-            size_chart = size_fig.to_html(full_html=False, include_plotlyjs=False)
+            def build_size_figure(data):
+                import plotly.express as px
+                
+                size_fig = px.pie(
+                    data, 
+                    values='Count', 
+                    names='Company Size', 
+                    title='Companies by Size',
+                    color='Company Size',
+                    color_discrete_sequence=self.color_scale
+                )
+                size_fig.update_traces(textposition='inside', textinfo='percent+label')
+                return size_fig
+            
+            size_chart = self._render_chart('company_size_distribution', size_counts, build_size_figure)
         else:
             size_chart = "<p>No company size data available</p>"
         
@@ -419,55 +609,70 @@ class DashboardGenerator:
         """
         # Create decision power vs company score scatter plot
         if 'decision_making_power' in df.columns and 'company_score' in df.columns:
-            scatter_fig = px.scatter(
-                df, 
-                x='decision_making_power', 
-                y='company_score',
-                color='lead_score' if 'lead_score' in df.columns else None,
-                size='lead_score' if 'lead_score' in df.columns else None,
-                hover_name='name' if 'name' in df.columns else None,
-                hover_data=['company', 'title'] if all(col in df.columns for col in ['company', 'title']) else None,
-                title='Stakeholder Decision Power vs Company Score',
-                color_continuous_scale=self.color_scale
-            )
-            scatter_fig.update_layout(
-                xaxis_title='Decision Making Power',
-                yaxis_title='Company Score',
-                xaxis=dict(range=[0, 1]),
-                yaxis=dict(range=[0, 1])
-            )
-            scatter_chart = scatter_fig.to_html(full_html=False, include_plotlyjs=False)
+            def build_scatter_figure(data):
+                import plotly.express as px
+                
+                scatter_fig = px.scatter(
+                    data, 
+                    x='decision_making_power', 
+                    y='company_score',
+                    color='lead_score' if 'lead_score' in data.columns else None,
+                    size='lead_score' if 'lead_score' in data.columns else None,
+                    hover_name='name' if 'name' in data.columns else None,
+                    hover_data=['company', 'title'] if all(col in data.columns for col in ['company', 'title']) else None,
+                    title='Stakeholder Decision Power vs Company Score',
+                    color_continuous_scale=self.color_scale
+                )
+                scatter_fig.update_layout(
+                    xaxis_title='Decision Making Power',
+                    yaxis_title='Company Score',
+                    xaxis=dict(range=[0, 1]),
+                    yaxis=dict(range=[0, 1])
+                )
+                return scatter_fig
+            
+            scatter_columns = [
+                col for col in ['decision_making_power', 'company_score', 'lead_score', 'name', 'company', 'title']
+                if col in df.columns
+            ]
+            scatter_data = df[scatter_columns]
+            
+            # Chart size grows with the point count, so large stakeholder sets are
+            # sampled, evenly across lead score quintiles when scores are available
+            if len(scatter_data) > self.max_scatter_points:
+                frac = self.max_scatter_points / len(scatter_data)
+                if 'lead_score' in scatter_data.columns:
+                    strata = pd.qcut(scatter_data['lead_score'], 5, duplicates='drop')
+                    scatter_data = scatter_data.groupby(strata, observed=True, dropna=False).sample(frac=frac, random_state=0)
+                else:
+                    scatter_data = scatter_data.sample(frac=frac, random_state=0)
+            
+            scatter_chart = self._render_chart('decision_power_scatter', scatter_data, build_scatter_figure)
         else:
             scatter_chart = "<p>No stakeholder scoring data available</p>"
         
         # Create job title distribution chart
         if 'title' in df.columns:
             # Extract job categories from titles
-            def categorize_title(title):
-                title = str(title).lower()
-                if any(keyword in title for keyword in ['ceo', 'chief', 'president', 'owner', 'founder']):
-                    return 'Executive'
-                elif any(keyword in title for keyword in ['director', 'vp', 'vice president', 'head']):
-                    return 'Director/VP'
-                elif any(keyword in title for keyword in ['manager', 'lead', 'senior']):
-                    return 'Manager'
-                else:
-                    return 'Other'
-            
-            df['job_category'] = df['title'].apply(categorize_title)
-            title_counts = df['job_category'].value_counts().reset_index()
+            job_category = pd.Series(self._categorize_titles(df['title']), index=df.index)
+            title_counts = job_category.value_counts().reset_index()
             title_counts.columns = ['Job Category', 'Count']
             
-            title_fig = px.pie(
-                title_counts, 
-                values='Count', 
-                names='Job Category', 
-                title='Stakeholders by Job Level',
-                color='Job Category',
-                color_discrete_sequence=self.color_scale
-            )
-            title_fig.update_traces(textposition='inside', textinfo='percent+label')
-            title_chart = title_fig.to_html(full_html=False, include_plotlyjs=False)
+            def build_title_figure(data):
+                import plotly.express as px
+                
+                title_fig = px.pie(
+                    data, 
+                    values='Count', 
+                    names='Job Category', 
+                    title='Stakeholders by Job Level',
+                    color='Job Category',
+                    color_discrete_sequence=self.color_scale
+                )
+                title_fig.update_traces(textposition='inside', textinfo='percent+label')
+                return title_fig
+            
+            title_chart = self._render_chart('job_level_distribution', title_counts, build_title_figure)
         else:
             title_chart = "<p>No job title data available</p>"
         
@@ -481,4 +686,20 @@ class DashboardGenerator:
         </div>
         """
         
-        return html_content
\ No newline at end of file
+        return html_content
+    
+    def _categorize_titles(self, titles):
+        """Categorize a column of job titles into job levels
+        
+        Args:
+            titles (pandas.Series): Job titles
+            
+        Returns:
+            numpy.ndarray: Job level of each title
+        """
+        lowered = titles.astype(object).str.lower()
+        conditions = [lowered.str.contains(pattern, na=False).to_numpy(dtype=bool)
+                      for pattern in _JOB_LEVEL_PATTERNS.values()]
+        
+        # np.select takes the first true condition, matching the level order
+        return np.select(conditions, list(_JOB_LEVEL_PATTERNS), default='Other')
@@ -0,0 +1,26 @@
+import sys
+
+import pytest
+
+
+@pytest.fixture(scope="session", autouse=True)
+def data_dirs(tmp_path_factory):
+    """Point the output and cache directories of every loaded src module at a temporary directory
+
+    Constructors create these directories, so without this the tests would write
+    into the repository's data/ tree, shared between pytest-xdist workers.
+    """
+    data_dir = tmp_path_factory.mktemp('data')
+    dirs = {
+        'OUTPUT_DATA_DIR': data_dir / 'output',
+        'CACHE_DIR': data_dir / 'cache'
+    }
+
+    with pytest.MonkeyPatch.context() as mp:
+        for name, module in list(sys.modules.items()):
+            if not name.startswith('src.'):
+                continue
+            for attr, path in dirs.items():
+                if hasattr(module, attr):
+                    mp.setattr(module, attr, path)
+        yield dirs
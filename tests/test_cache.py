@@ -0,0 +1,21 @@
+from src.utils.cache import FileCache
+
+
+def test_set_and_get(tmp_path):
+    """Test that cached values round-trip through disk"""
+    cache = FileCache(tmp_path / 'hunter', ttl=60)
+    stakeholders = [{'name': 'Jane Doe', 'decision_making_power': 0.9}]
+
+    assert cache.get('companya.com') is None
+    cache.set('companya.com', stakeholders)
+
+    assert cache.get('companya.com') == stakeholders
+    assert FileCache(tmp_path / 'hunter', ttl=60).get('companya.com') == stakeholders
+
+
+def test_expired_entry(tmp_path):
+    """Test that entries past their TTL are treated as missing"""
+    cache = FileCache(tmp_path, ttl=-1)
+    cache.set('companya.com', [])
+
+    assert cache.get('companya.com') is None
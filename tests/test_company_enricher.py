@@ -0,0 +1,33 @@
+import pytest
+import pandas as pd
+
+from src.data_enrichment.company_enricher import CompanyEnricher
+
+
+@pytest.fixture
+def company_enricher():
+    """Create a CompanyEnricher instance for testing"""
+    return CompanyEnricher()
+
+
+@pytest.fixture
+def mock_enriched_df():
+    """Create a mock DataFrame with the columns produced by the extract steps"""
+    companies_data = {
+        'name': ['Sign Co', 'Print Co', 'Other Co'],
+        'industry': ['Signage', 'Printing', None],
+        'company_size': ['Large', 'Small', 'Micro'],
+        'products': [['Signs', 'Banners', 'Vehicle Wraps'], ['Graphics'], []],
+        'materials': [['Vinyl', 'PVC'], 'Film', ['Wood']],
+        'target_markets': [['Retail', 'Events', 'Outdoor Advertising', 'Transportation'], ['Corporate'], ['Education']]
+    }
+    # A non-default index must not affect the row alignment of the scores
+    return pd.DataFrame(companies_data, index=[10, 20, 30])
+
+
+def test_calculate_relevance_scores(company_enricher, mock_enriched_df):
+    """Test vectorized relevance scoring"""
+    scores = company_enricher._calculate_relevance_scores(mock_enriched_df)
+
+    # (1.0 + 0.6 + 0.4 + 1.0 + 1.0) / 5, (0.8 + 0.2 + 0.2 + 0 + 0.5) / 5, (0 + 0 + 0 + 0 + 0.3) / 5
+    assert list(scores) == [0.8, 0.34, 0.06]
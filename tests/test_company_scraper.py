@@ -3,13 +3,6 @@ import pandas as pd
 from unittest.mock import patch, MagicMock
 from bs4 import BeautifulSoup
 import requests
-import os
-import sys
-from pathlib import Path
-
-# Add project root to path
-project_root = Path(__file__).parent.parent
-sys.path.append(str(project_root))
 
 from src.data_collection.company_scraper import CompanyScraper
 
@@ -72,10 +65,10 @@ def test_init(company_scraper):
     assert company_scraper.industry_keywords is not None
 
 
-@patch('requests.get')
+@patch('requests.Session.get')
 def test_collect_companies_data(mock_get, company_scraper, mock_events_df, mock_associations_df):
     """Test collect_companies_data method"""
-    # Mock response for requests.get
+    # Mock response for the scraper's session
     mock_response = MagicMock()
     mock_response.text = '<html><body>Test HTML</body></html>'
     mock_response.raise_for_status = MagicMock()
@@ -95,10 +88,10 @@ def test_collect_companies_data(mock_get, company_scraper, mock_events_df, mock_
             assert 'Test Company 2' in result['name'].values
 
 
-@patch('requests.get')
+@patch('requests.Session.get')
 def test_get_companies_from_event(mock_get, company_scraper):
     """Test _get_companies_from_event method"""
-    # Mock response for requests.get
+    # Mock response for the scraper's session
     mock_response = MagicMock()
     mock_response.text = '<html><body><a href="/exhibitors">Exhibitors</a></body></html>'
     mock_response.raise_for_status = MagicMock()
@@ -120,14 +113,14 @@ def test_get_companies_from_event(mock_get, company_scraper):
             # Call the method
             result = company_scraper._get_companies_from_event(event)
             
-            # Check that requests.get was called with the event URL
-            mock_get.assert_called_with('https://test-event.com', headers=company_scraper.headers, timeout=10)
+            # Check that the session fetched the event URL
+            mock_get.assert_called_with('https://test-event.com', timeout=10)
 
 
-@patch('requests.get')
+@patch('requests.Session.get')
 def test_get_companies_from_floor_plan(mock_get, company_scraper):
     """Test _get_companies_from_floor_plan method"""
-    # Mock response for requests.get
+    # Mock response for the scraper's session
     mock_response = MagicMock()
     mock_response.text = '<html><body><a href="/floorplan">Floor Plan</a></body></html>'
     mock_response.raise_for_status = MagicMock()
@@ -175,7 +168,7 @@ def test_parse_mapyourshow_floor_plan(company_scraper):
         </body>
     </html>
     '''
-    soup = BeautifulSoup(html, 'html.parser')
+    soup = BeautifulSoup(html, 'lxml')
     
     # Create a test event
     event = {
@@ -188,7 +181,7 @@ def test_parse_mapyourshow_floor_plan(company_scraper):
     }
     
     # Call the method
-    with patch('requests.get'):
+    with patch('requests.Session.get'):
         result = company_scraper._parse_mapyourshow_floor_plan(soup, 'https://test-event.com/floorplan', event)
     
     # Check the result
@@ -216,7 +209,7 @@ def test_parse_generic_floor_plan(company_scraper):
         </body>
     </html>
     '''
-    soup = BeautifulSoup(html, 'html.parser')
+    soup = BeautifulSoup(html, 'lxml')
     
     # Create a test event
     event = {
@@ -0,0 +1,191 @@
+import io
+import pytest
+import numpy as np
+import pandas as pd
+import plotly.express as px
+from plotly.offline import get_plotlyjs_version
+from pathlib import Path
+
+from src.visualization.dashboard_generator import DashboardGenerator
+from src.utils.cache import FileCache
+
+
+@pytest.fixture
+def dashboard_generator(tmp_path):
+    """Create a DashboardGenerator instance writing to a temporary directory"""
+    generator = DashboardGenerator()
+    generator.output_dir = tmp_path
+    generator.dashboard_dir = tmp_path / 'dashboard'
+    generator.chart_cache = FileCache(tmp_path / 'cache', ttl=60)
+    return generator
+
+
+@pytest.fixture
+def mock_leads_df():
+    """Create a mock leads DataFrame for testing"""
+    leads_data = {
+        'name': ['John Doe', 'Jane Smith'],
+        'title': ['CEO', 'Sales Manager'],
+        'lead_score': [0.9, 0.4],
+        'tier': ['Tier 1', 'Tier 2'],
+        'company': ['Company A', 'Company B'],
+        'industry': ['Signage', 'Printing'],
+        'company_size': ['Large', 'Small'],
+        'decision_making_power': [0.9, 0.6],
+        'company_score': [0.8, 0.5],
+        'personalized_outreach': ['Dear John, ' + 'x' * 60, '']
+    }
+    return pd.DataFrame(leads_data, index=[5, 2])
+
+
+def test_write_table_rows(dashboard_generator):
+    """Test HTML row rendering with expandable long-text cells"""
+    df = pd.DataFrame({
+        'Stakeholder': ['John Doe', 'Jane Smith'],
+        'Lead Score': [0.9, 0.4],
+        'Personalized Outreach': ['Dear John, ' + 'x' * 60, '']
+    })
+
+    f = io.StringIO()
+    dashboard_generator._write_table_rows(f, df)
+    rows = f.getvalue().split('\n<tr>')
+
+    assert len(rows) == 2
+    assert rows[0].startswith('<tr><td>John Doe</td><td>0.9</td>')
+    assert '<div class="preview-text">Dear John, ' + 'x' * 39 + '...</div>' in rows[0]
+    assert rows[1] == '<td>Jane Smith</td><td>0.4</td><td></td></tr>\n'
+
+
+def test_generate_dashboard(dashboard_generator, mock_leads_df):
+    """Test that the dashboard is written with the lead table and charts"""
+    dashboard_path = dashboard_generator.generate_dashboard(mock_leads_df)
+
+    html_content = Path(dashboard_path).read_text(encoding='utf-8')
+    assert '<table id="leads-table"' in html_content
+    assert '<td>John Doe</td>' in html_content
+    assert 'Lead Distribution by Tier' in html_content
+    assert 'Stakeholders by Job Level' in html_content
+
+    # plotly.js is loaded once, matching the version the charts were built with
+    assert html_content.count('cdn.plot.ly') == 1
+    assert f'plotly-{get_plotlyjs_version()}.min.js' in html_content
+
+    # Styles and scripts are written once next to the page
+    assert '<link rel="stylesheet" href="dashboard/dashboard.css">' in html_content
+    assert '<script src="dashboard/dashboard.js"></script>' in html_content
+    assert (dashboard_generator.dashboard_dir / 'dashboard.css').exists()
+    assert 'DataTable(' in (dashboard_generator.dashboard_dir / 'dashboard.js').read_text(encoding='utf-8')
+
+    # Chart helpers work on column selections, leaving the caller's frame untouched
+    assert 'job_category' not in mock_leads_df.columns
+
+
+def test_render_chart_uses_cache(dashboard_generator):
+    """Test that charts are only rebuilt when their data changes"""
+    built = []
+
+    def build_figure(data):
+        built.append(list(data['Tier']))
+        return px.pie(data, values='Count', names='Tier')
+
+    counts = pd.DataFrame({'Tier': ['Tier 1', 'Tier 2'], 'Count': [3, 3]})
+
+    first = dashboard_generator._render_chart('tier_distribution', counts, build_figure)
+    second = dashboard_generator._render_chart('tier_distribution', counts.copy(), build_figure)
+    assert first == second
+    assert built == [['Tier 1', 'Tier 2']]
+
+    # Same rows in a different order change the chart, so they are rendered again
+    dashboard_generator._render_chart('tier_distribution', counts.iloc[::-1], build_figure)
+    assert built == [['Tier 1', 'Tier 2'], ['Tier 2', 'Tier 1']]
+
+    # A changed figure builder is rendered again for the same data
+    def build_titled_figure(data):
+        built.append(list(data['Tier']))
+        return px.pie(data, values='Count', names='Tier', title='Lead Distribution by Tier')
+
+    dashboard_generator._render_chart('tier_distribution', counts, build_titled_figure)
+    assert len(built) == 3
+
+
+def test_generate_dashboard_truncates_lead_table(dashboard_generator, mock_leads_df):
+    """Test that only the top leads are rendered, with the full list linked as CSV"""
+    dashboard_generator.max_rows = 1
+    leads_df = mock_leads_df.iloc[::-1]
+
+    dashboard_path = dashboard_generator.generate_dashboard(leads_df)
+
+    html_content = Path(dashboard_path).read_text(encoding='utf-8')
+    assert '<td>John Doe</td>' in html_content
+    assert '<td>Jane Smith</td>' not in html_content
+    assert '<a href="leads_full.csv" download>' in html_content
+    assert list(pd.read_csv(dashboard_generator.output_dir / 'leads_full.csv')['name']) == ['Jane Smith', 'John Doe']
+
+
+def test_categorize_titles(dashboard_generator):
+    """Test vectorized job level categorization"""
+    titles = pd.Series(['CEO', 'VP of Sales', 'Head of Marketing Director', 'Team Lead', 'Engineer', '', None])
+
+    result = dashboard_generator._categorize_titles(titles)
+
+    assert list(result) == ['Executive', 'Director/VP', 'Director/VP', 'Manager', 'Other', 'Other', 'Other']
+
+
+def test_write_table_rows_escapes_html(dashboard_generator):
+    """Test that cell text is HTML-escaped and previews are cut before escaping"""
+    df = pd.DataFrame({
+        'Company': ['Signs & Co <West>'],
+        'Lead Score': [0.9],
+        'Personalized Outreach': ['x' * 49 + '&' + 'y' * 10]
+    })
+
+    f = io.StringIO()
+    dashboard_generator._write_table_rows(f, df)
+    row = f.getvalue()
+
+    assert row.startswith('<tr><td>Signs &amp; Co &lt;West&gt;</td><td>0.9</td>')
+    assert '<div class="preview-text">' + 'x' * 49 + '&amp;...</div>' in row
+    assert '<div class="full-text" style="display:none">' + 'x' * 49 + '&amp;' + 'y' * 10 + '</div>' in row
+
+
+def test_scatter_chart_is_sampled(dashboard_generator, monkeypatch):
+    """Test that large stakeholder sets are sampled before plotting"""
+    charted = {}
+
+    def fake_render_chart(name, data, build_figure):
+        charted[name] = data
+        return ''
+
+    monkeypatch.setattr(dashboard_generator, '_render_chart', fake_render_chart)
+    dashboard_generator.max_scatter_points = 100
+
+    stakeholders_df = pd.DataFrame({
+        'decision_making_power': [i / 1000 for i in range(1000)],
+        'company_score': [0.5] * 1000,
+        'lead_score': [i / 1000 for i in range(1000)]
+    })
+    dashboard_generator._create_stakeholder_charts(stakeholders_df)
+
+    scatter_data = charted['decision_power_scatter']
+    assert len(scatter_data) == 100
+    # Each lead score quintile keeps its share of the points
+    assert (pd.cut(scatter_data['lead_score'], 5).value_counts() == 20).all()
+
+
+def test_float32_scores_render_as_decimals(dashboard_generator, mock_leads_df):
+    """Test that float32 scores are shown with their decimal text in the table and charts"""
+    leads_df = mock_leads_df.assign(
+        lead_score=np.array([0.81, 0.4], dtype=np.float32),
+        decision_making_power=np.array([0.9, 0.6], dtype=np.float32)
+    )
+
+    dashboard_path = dashboard_generator.generate_dashboard(leads_df)
+
+    html_content = Path(dashboard_path).read_text(encoding='utf-8')
+    assert '<td>0.81</td>' in html_content
+    assert '0.8100000023841858' not in html_content
+    assert '0.8999999761581421' not in html_content
+
+    # Chart data gets float64 values with the same decimals before plotting
+    chart_data = dashboard_generator._widen_float32(leads_df[['lead_score', 'name']])
+    assert chart_data['lead_score'].tolist() == [0.81, 0.4]
@@ -0,0 +1,68 @@
+import pandas as pd
+from types import SimpleNamespace
+
+from src.utils.data_io import write_csv, write_parquet, read_parquet, read_csv_cached
+
+
+def test_write_csv(tmp_path):
+    """Test that CSV output round-trips through pandas"""
+    df = pd.DataFrame({'name': ['Company A', 'Company, B'], 'score': [0.9, 0.5]})
+    path = tmp_path / 'companies.csv'
+
+    write_csv(df, path)
+
+    pd.testing.assert_frame_equal(pd.read_csv(path), df)
+
+
+def test_write_csv_with_list_column(tmp_path, monkeypatch):
+    """Test that frames with list columns are written by pandas without building an Arrow table"""
+    import src.utils.data_io as data_io_module
+
+    def fail_from_pandas(*args, **kwargs):
+        raise AssertionError('Arrow table built for a list column')
+
+    monkeypatch.setattr(data_io_module, 'pa', SimpleNamespace(
+        Table=SimpleNamespace(from_pandas=fail_from_pandas),
+        ArrowException=data_io_module.pa.ArrowException
+    ))
+    df = pd.DataFrame({'name': ['Company A', 'Company B'], 'products': [None, ['Signs', 'Banners']]})
+    path = tmp_path / 'companies.csv'
+
+    write_csv(df, path)
+
+    assert pd.read_csv(path)['products'].iloc[1] == "['Signs', 'Banners']"
+
+
+def test_parquet_round_trip_keeps_lists(tmp_path):
+    """Test that list columns come back from Parquet as Python lists"""
+    df = pd.DataFrame({'name': ['Company A', 'Company B'], 'products': [['Signs', 'Banners'], []]})
+    path = tmp_path / 'companies.parquet'
+
+    write_parquet(df, path)
+    result = read_parquet(path)
+
+    assert result['products'].tolist() == [['Signs', 'Banners'], []]
+    pd.testing.assert_frame_equal(result, df)
+
+
+def test_read_csv_cached(tmp_path):
+    """Test that the Parquet copy is reused until the CSV changes"""
+    path = tmp_path / 'companies.csv'
+    cache_dir = tmp_path / 'cache'
+    pd.DataFrame({'name': ['Company A'], 'score': [0.9]}).to_csv(path, index=False)
+
+    first = read_csv_cached(path, cache_dir)
+    assert len(list(cache_dir.glob('companies_*.parquet'))) == 1
+    pd.testing.assert_frame_equal(read_csv_cached(path, cache_dir), first)
+
+    # Copies of other CSVs sharing the name prefix are left alone
+    other_path = tmp_path / 'companies_enriched.csv'
+    pd.DataFrame({'name': ['Company C']}).to_csv(other_path, index=False)
+    read_csv_cached(other_path, cache_dir)
+
+    pd.DataFrame({'name': ['Company A', 'Company B'], 'score': [0.9, 0.5]}).to_csv(path, index=False)
+    assert list(read_csv_cached(path, cache_dir)['name']) == ['Company A', 'Company B']
+
+    # The outdated copy is replaced rather than kept next to the new one, leaving one copy per CSV
+    assert len(list(cache_dir.iterdir())) == 2
+    assert len(list(cache_dir.glob('companies_enriched_*.parquet'))) == 1
@@ -0,0 +1,152 @@
+import pytest
+import numpy as np
+import pandas as pd
+
+from src.lead_scoring.lead_scorer import LeadScorer
+
+
+@pytest.fixture
+def lead_scorer():
+    """Create a LeadScorer instance for testing"""
+    return LeadScorer()
+
+
+@pytest.fixture
+def mock_companies_df():
+    """Create a mock companies DataFrame for testing"""
+    companies_data = {
+        'name': ['Sign Co', 'Print Co', 'Build Co', 'Other Co'],
+        'industry': ['Signage', 'Digital Printing', 'Construction', None],
+        'description': ['Signs and banners on vinyl', 'Graphics', None, 'Software'],
+        'company_size': ['Large', None, 'unknown', 'Micro'],
+        'employees': [None, 300, 5, 2000],
+        'products': [['Signs', 'Banners', 'Displays', 'Wraps'], 'Banners', [], None],
+        'materials': [['Vinyl', 'PVC'], ['Plastic'], 'Composite', []]
+    }
+    # A non-default index must not affect the row alignment of the scores
+    return pd.DataFrame(companies_data, index=[10, 20, 30, 40])
+
+
+def test_calculate_size_scores(lead_scorer, mock_companies_df):
+    """Test size scores from size categories with employees count fallback"""
+    scores = lead_scorer._calculate_size_scores(lead_scorer._add_lowercase_columns(mock_companies_df))
+
+    assert list(scores) == [1.0, 0.8, 0.2, 0.2]
+
+
+def test_calculate_industry_scores(lead_scorer, mock_companies_df):
+    """Test industry relevance tiers"""
+    scores = lead_scorer._calculate_industry_scores(lead_scorer._add_lowercase_columns(mock_companies_df))
+
+    assert list(scores) == [1.0, 0.8, 0.4, 0.2]
+
+
+def test_calculate_basic_relevance_scores(lead_scorer, mock_companies_df):
+    """Test basic relevance from industry and description keywords"""
+    scores = lead_scorer._calculate_basic_relevance_scores(lead_scorer._add_lowercase_columns(mock_companies_df))
+
+    assert list(scores) == pytest.approx([0.95, 0.85, 0.5, 0.5])
+
+
+def test_calculate_product_fit_scores(lead_scorer, mock_companies_df):
+    """Test product fit from relevant products (up to 3) and materials"""
+    scores = lead_scorer._calculate_product_fit_scores(mock_companies_df)
+
+    assert list(scores) == pytest.approx([1.0, 0.7, 0.6, 0.5])
+
+
+@pytest.fixture
+def mock_scored_stakeholders_df():
+    """Create a mock scored stakeholders DataFrame for testing"""
+    stakeholders_data = {
+        'name': ['Jane Doe', 'John Roe', 'Ann Poe'],
+        'title': ['CEO', 'Sales Manager', 'Owner'],
+        'company': ['Sign Co', 'Print Co', 'Unknown Co'],
+        'email': ['jane@signco.com', 'john@printco.com', 'ann@unknown.com'],
+        'decision_making_power': [0.9, 0.6, 0.9],
+        'company_score': [1.0, 0.5, 0.5],
+        'stakeholder_score': [1.0, 0.5, 0.9]
+    }
+    return pd.DataFrame(stakeholders_data)
+
+
+def test_generate_leads(lead_scorer, mock_companies_df, mock_scored_stakeholders_df):
+    """Test that leads combine stakeholder scores with company information"""
+    companies_df = mock_companies_df.assign(target_markets=[['Retail'], [], None, []])
+    leads_df = lead_scorer._generate_leads(companies_df, mock_scored_stakeholders_df)
+
+    # Stakeholders of unknown companies are dropped
+    assert list(leads_df['name']) == ['Jane Doe', 'John Roe']
+    assert list(leads_df['industry']) == ['Signage', 'Digital Printing']
+    assert list(leads_df['lead_score']) == [1.0, 0.5]
+    assert list(leads_df['lead_id']) == ['LEAD-0001', 'LEAD-0002']
+
+
+def test_generate_leads_tiers(lead_scorer, mock_scored_stakeholders_df):
+    """Test that lead tiers follow the (0, 0.3], (0.3, 0.6] and (0.6, 1.0] score bins"""
+    companies_df = pd.DataFrame({
+        'name': ['Sign Co', 'Print Co', 'Unknown Co'],
+        'industry': [None, None, None],
+        'company_size': [None, None, None],
+        'products': [[], [], []],
+        'materials': [[], [], []],
+        'target_markets': [[], [], []]
+    })
+    stakeholders_df = mock_scored_stakeholders_df.assign(
+        company_score=[0.3, 0.6, 0.0], stakeholder_score=[0.3, 0.6, 0.0])
+    leads_df = lead_scorer._generate_leads(companies_df, stakeholders_df)
+
+    assert list(leads_df['lead_score']) == [0.6, 0.3, 0.0]
+    assert list(leads_df['tier'].astype(object).fillna('')) == ['Tier 2', 'Tier 3', '']
+    assert list(leads_df['tier'].cat.categories) == ['Tier 3', 'Tier 2', 'Tier 1']
+
+
+def test_generate_leads_with_duplicate_companies(lead_scorer, mock_companies_df, mock_scored_stakeholders_df):
+    """Test that duplicate company names do not duplicate leads"""
+    companies_df = pd.concat([mock_companies_df, mock_companies_df.iloc[[0]].assign(industry='Display')])
+    companies_df['target_markets'] = [[]] * len(companies_df)
+    leads_df = lead_scorer._generate_leads(companies_df, mock_scored_stakeholders_df)
+
+    assert list(leads_df['name']) == ['Jane Doe', 'John Roe']
+    assert leads_df.loc[leads_df['name'] == 'Jane Doe', 'industry'].item() == 'Display'
+
+
+def test_score_stakeholders(lead_scorer, mock_scored_stakeholders_df):
+    """Test stakeholder scoring adds score columns without modifying the input"""
+    stakeholders_df = mock_scored_stakeholders_df.drop(columns=['company_score', 'stakeholder_score'])
+    companies_df = pd.DataFrame({'name': ['Sign Co', 'Print Co'], 'company_score': [1.0, 0.5]})
+
+    scored_df = lead_scorer._score_stakeholders(stakeholders_df, companies_df)
+
+    assert 'company_score' not in stakeholders_df.columns
+    # Unknown companies get the median company score
+    assert list(scored_df['company_score']) == [1.0, 0.5, 0.75]
+    assert scored_df['stakeholder_score'].max() == 1.0
+
+
+def test_calculate_decision_powers(lead_scorer):
+    """Test decision making power tiers from job titles"""
+    stakeholders_df = pd.DataFrame({
+        'title': ['Chief Executive Officer', 'VP of Sales', 'Account Manager', 'Designer', '', None]
+    })
+    scores = lead_scorer._calculate_decision_powers(stakeholders_df)
+
+    assert list(scores) == [1.0, 0.8, 0.6, 0.4, 0.5, 0.5]
+    assert list(lead_scorer._calculate_decision_powers(pd.DataFrame(index=range(2)))) == [0.5, 0.5]
+
+
+def test_score_leads_uses_float32_scores(lead_scorer, mock_companies_df, mock_scored_stakeholders_df):
+    """Test that score columns are float32 and tiers still match the score bins"""
+    companies_df = mock_companies_df.assign(target_markets=[[]] * len(mock_companies_df))
+    stakeholders_df = mock_scored_stakeholders_df.drop(columns=['company_score', 'stakeholder_score'])
+
+    scored_companies_df, scored_stakeholders_df, leads_df = lead_scorer.score_leads(companies_df, stakeholders_df)
+
+    for col in ['size_score', 'industry_score', 'product_fit_score', 'company_score']:
+        assert scored_companies_df[col].dtype == np.float32
+    for col in ['lead_score', 'company_score', 'stakeholder_score', 'decision_making_power']:
+        assert leads_df[col].dtype == np.float32
+
+    expected_tiers = pd.cut(leads_df['lead_score'].astype(float).round(2), bins=[0, 0.3, 0.6, 1.0],
+                            labels=['Tier 3', 'Tier 2', 'Tier 1'])
+    assert list(leads_df['tier']) == list(expected_tiers)
@@ -1,142 +1,305 @@
 import pytest
 import pandas as pd
-from unittest.mock import patch, MagicMock
-import os
-import sys
-from pathlib import Path
+from types import SimpleNamespace
 
-# Add project root to path
-project_root = Path(__file__).parent.parent
-sys.path.append(str(project_root))
+import src.outreach.message_generator as message_generator_module
+from src.outreach.message_generator import MessageGenerator
+from src.utils.cache import FileCache
 
-from src.outreach_generation.message_generator import MessageGenerator
+_FAKE_COMPLETION = SimpleNamespace(
+    choices=[SimpleNamespace(message=SimpleNamespace(content='{"subject": "Tedlar for Company A", "body": "Hello"}'))]
+)
 
 
-@pytest.fixture
-def message_generator():
-    """Create a MessageGenerator instance for testing"""
-    return MessageGenerator()
+@pytest.fixture(scope="module", autouse=True)
+def patched_openai():
+    """Replace the OpenAI client class and API key once for every test in this module
 
+    The fake client records its completion requests and answers with _FAKE_COMPLETION.
+    """
+    requests = []
 
-@pytest.fixture
+    def create(**kwargs):
+        requests.append(kwargs)
+        return _FAKE_COMPLETION
+
+    client = SimpleNamespace(
+        chat=SimpleNamespace(completions=SimpleNamespace(create=create)),
+        settings={},
+        requests=requests
+    )
+
+    def fake_openai(**kwargs):
+        client.settings = kwargs
+        return client
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(message_generator_module, 'OpenAI', fake_openai)
+        mp.setattr(message_generator_module, 'OPENAI_API_KEY', 'test_api_key')
+        yield client
+
+
+@pytest.fixture(scope="module")
+def message_generator(tmp_path_factory):
+    """Create a MessageGenerator instance shared by the tests in this module"""
+    generator = MessageGenerator()
+    generator.output_dir = tmp_path_factory.mktemp('messages')
+    return generator
+
+
+@pytest.fixture(scope="module")
 def mock_stakeholders_df():
-    """Create a mock stakeholders DataFrame for testing"""
+    """Create a mock stakeholders DataFrame shared by the tests, which must not modify it"""
     stakeholders_data = {
-        'name': ['John Doe', 'Jane Smith'],
-        'title': ['CEO', 'CTO'],
-        'company': ['Company A', 'Company B'],
-        'email': ['john@companya.com', 'jane@companyb.com'],
-        'linkedin_url': ['https://linkedin.com/in/johndoe', 'https://linkedin.com/in/janesmith'],
-        'decision_making_power': [0.8, 0.7],
-        'relevance_score': [0.9, 0.8],
-        'priority_score': [0.85, 0.75]
+        'id': ['STAKE0001', 'STAKE0002', 'STAKE0003'],
+        'name': ['John Doe', 'Jane Smith', 'Sam Lee'],
+        'title': ['CEO', 'CTO', 'Purchasing Manager'],
+        'company': ['Company A', 'Company B', 'Company A'],
+        'email': ['john@companya.com', 'jane@companyb.com', 'sam@companya.com'],
+        'priority_score': [0.95, 0.75, 0.5]
     }
     return pd.DataFrame(stakeholders_data)
 
 
 @pytest.fixture
+def first_lead(mock_stakeholders_df):
+    """Get the first mock stakeholder as a lead dictionary"""
+    return mock_stakeholders_df.iloc[0].to_dict()
+
+
+@pytest.fixture(scope="module")
 def mock_companies_df():
-    """Create a mock companies DataFrame for testing"""
+    """Create a mock companies DataFrame shared by the tests, which must not modify it"""
     companies_data = {
         'name': ['Company A', 'Company B'],
-        'website': ['https://companya.com', 'https://companyb.com'],
-        'industry': ['Manufacturing', 'Technology'],
-        'description': ['Manufactures solar panels', 'Produces electronic devices'],
-        'products': [['Solar Panels', 'Inverters'], ['Smartphones', 'Tablets']],
-        'materials': [['Glass', 'Silicon'], ['Plastic', 'Metal']],
-        'target_markets': [['Residential', 'Commercial'], ['Consumer', 'Business']],
-        'company_size': ['Medium', 'Large'],
-        'annual_revenue': ['$10M-$50M', '$100M-$500M']
+        'industry': ['Signage', 'Printing'],
+        'description': ['Makes outdoor signs', 'Large format printing'],
+        'products': [['Signs', 'Banners', 'Wraps'], ['Graphics']],
+        'target_markets': [['Retail', 'Events'], ['Corporate']]
     }
     return pd.DataFrame(companies_data)
 
 
-def test_init(message_generator):
-    """Test MessageGenerator initialization"""
-    assert message_generator is not None
-    assert hasattr(message_generator, 'openai_api_key')
-    assert hasattr(message_generator, 'model')
-
-
-def test_generate_template_message(message_generator, mock_stakeholders_df):
-    """Test template message generation when no API key is available"""
-    # Set API key to empty to force template message generation
-    message_generator.openai_api_key = ""
-    
-    # Get the first stakeholder
-    lead = mock_stakeholders_df.iloc[0].to_dict()
-    
-    # Generate template message
-    message = message_generator._generate_template_message(lead)
-    
-    # Check that the message contains the stakeholder's name and company
-    assert isinstance(message, str)
-    assert lead['name'] in message
-    assert lead['company'] in message
-    assert "I'm reaching out" in message
-
-
-@patch('openai.OpenAI')
-def test_generate_personalized_message_with_api(mock_openai, message_generator, mock_stakeholders_df):
-    """Test personalized message generation with OpenAI API"""
-    # Set up mock OpenAI client
-    mock_client = MagicMock()
-    mock_openai.return_value = mock_client
-    
-    # Set up mock response
-    mock_completion = MagicMock()
-    mock_completion.choices = [MagicMock(message=MagicMock(content="Test personalized message"))]
-    mock_client.chat.completions.create.return_value = mock_completion
-    
-    # Set API key to a non-empty value
-    message_generator.openai_api_key = "test_api_key"
-    
-    # Get the first stakeholder
-    lead = mock_stakeholders_df.iloc[0].to_dict()
-    
-    # Generate personalized message
-    message = message_generator.generate_personalized_message(lead)
-    
-    # Check that the OpenAI API was called
-    mock_client.chat.completions.create.assert_called_once()
-    assert message == "Test personalized message"
-
-
-@patch.object(MessageGenerator, 'generate_personalized_message')
-def test_generate_messages_for_stakeholders(mock_generate, message_generator, mock_stakeholders_df, mock_companies_df):
-    """Test generating messages for all stakeholders"""
-    # Set up mock to return a test message
-    mock_generate.return_value = "Test message for {name}"
-    
-    # Generate messages for stakeholders
-    result_df = message_generator.generate_messages_for_stakeholders(mock_stakeholders_df, mock_companies_df)
-    
-    # Check the result
-    assert isinstance(result_df, pd.DataFrame)
-    assert len(result_df) == len(mock_stakeholders_df)
-    assert 'outreach_message' in result_df.columns
-    assert mock_generate.call_count == len(mock_stakeholders_df)
-
-
-def test_prepare_prompt(message_generator, mock_stakeholders_df, mock_companies_df):
-    """Test prompt preparation for OpenAI API"""
-    # Get the first stakeholder
-    lead = mock_stakeholders_df.iloc[0].to_dict()
-    
+@pytest.fixture(scope="module")
+def companies_by_name(mock_companies_df):
+    """Index the mock company records by company name"""
+    return {company['name']: company for company in mock_companies_df.to_dict('records')}
+
+
+def test_init(message_generator, patched_openai, monkeypatch):
+    """Test that the OpenAI client is only created when an API key is configured"""
+    assert message_generator.model
+    assert message_generator.client is patched_openai
+    assert patched_openai.settings['api_key'] == 'test_api_key'
+
+    monkeypatch.setattr(message_generator_module, 'OPENAI_API_KEY', '')
+    assert MessageGenerator().client is None
+
+
+def test_generate_messages_templates(message_generator, mock_stakeholders_df, mock_companies_df, monkeypatch):
+    """Test template selection and personalization without AI messages"""
+    monkeypatch.setattr(message_generator, 'client', None)
+
+    result = message_generator.generate_messages(mock_stakeholders_df, mock_companies_df)
+
+    assert list(result['id']) == ['STAKE0001', 'STAKE0002', 'STAKE0003']
+    assert list(result['template_type']) == ['initial_outreach', 'initial_outreach', 'follow_up']
+    assert result.loc[0, 'subject'] == "DuPont Tedlar for Company A's Signage Applications"
+    assert 'your Signs, Banners' in result.loc[0, 'body']
+    assert 'your Retail projects' in result.loc[0, 'body']
+    assert result.loc[2, 'subject'] == "Following up: DuPont Tedlar for Company A"
+
+
+def test_generate_messages_save(message_generator, mock_stakeholders_df, mock_companies_df, monkeypatch, tmp_path):
+    """Test that messages are only written to CSV when requested"""
+    monkeypatch.setattr(message_generator, 'client', None)
+    monkeypatch.setattr(message_generator, 'output_dir', tmp_path)
+    output_file = tmp_path / 'stakeholders_with_messages.csv'
+
+    result = message_generator.generate_messages(mock_stakeholders_df, mock_companies_df)
+    assert not output_file.exists()
+    assert list(result.index) == list(mock_stakeholders_df.index)
+
+    message_generator.generate_messages(mock_stakeholders_df, mock_companies_df, save=True)
+    saved = pd.read_csv(output_file)
+    assert list(saved['stakeholder_id']) == ['STAKE0001', 'STAKE0002', 'STAKE0003']
+
+
+def test_generate_messages_uses_ai_for_high_priority(message_generator, mock_stakeholders_df, mock_companies_df, monkeypatch):
+    """Test that only high-priority stakeholders get AI messages, and failures fall back to templates"""
+    requested = []
+
+    def fake_ai_message(message_vars):
+        requested.append(message_vars['company'])
+        return {'subject': f"Hi {message_vars['name']}", 'body': f"As {message_vars['title']} you know..."}
+
+    monkeypatch.setattr(message_generator, 'client', object())
+    monkeypatch.setattr(message_generator, '_generate_ai_message', fake_ai_message)
+
+    result = message_generator.generate_messages(mock_stakeholders_df, mock_companies_df)
+
+    assert requested == ['Company A']
+    assert result.loc[0, 'subject'] == 'Hi John Doe'
+    assert result.loc[0, 'body'] == 'As CEO you know...'
+    assert result.loc[1, 'subject'] == "DuPont Tedlar for Company B's Printing Applications"
+
+    # High-priority stakeholders at the same company share one AI message
+    requested.clear()
+    stakeholders_df = mock_stakeholders_df.assign(priority_score=[0.95, 0.75, 0.9])
+    result = message_generator.generate_messages(stakeholders_df, mock_companies_df)
+
+    assert requested == ['Company A']
+    assert list(result['subject']) == [
+        'Hi John Doe', "DuPont Tedlar for Company B's Printing Applications", 'Hi Sam Lee'
+    ]
+    assert result.loc[2, 'body'] == 'As Purchasing Manager you know...'
+
+    monkeypatch.setattr(message_generator, '_generate_ai_message', lambda message_vars: None)
+    result = message_generator.generate_messages(mock_stakeholders_df, mock_companies_df)
+
+    assert result.loc[0, 'subject'] == "DuPont Tedlar for Company A's Signage Applications"
+
+
+def test_generate_ai_messages_concurrently(message_generator, monkeypatch):
+    """Test that concurrent AI messages are returned under their keys"""
+    monkeypatch.setattr(
+        message_generator,
+        '_generate_ai_message',
+        lambda message_vars: {'subject': message_vars['name'], 'body': ''}
+    )
+
+    ai_requests = {0: {'name': 'John Doe'}, 4: {'name': 'Sam Lee'}}
+    result = message_generator._generate_ai_messages_concurrently(ai_requests)
+
+    assert result == {0: {'subject': 'John Doe', 'body': ''}, 4: {'subject': 'Sam Lee', 'body': ''}}
+    assert message_generator._generate_ai_messages_concurrently({}) == {}
+
+
+def test_generate_messages_event_based(message_generator, mock_stakeholders_df, mock_companies_df, monkeypatch):
+    """Test that exhibiting companies get the event template for the most relevant event"""
+    monkeypatch.setattr(message_generator, 'client', None)
+    events_df = pd.DataFrame({
+        'name': ['Sign Expo', 'Print Show'],
+        'location': ['Las Vegas', 'Chicago'],
+        'date': ['April', 'May'],
+        'relevance_score': [0.6, 0.9],
+        'exhibitors': [['company b'], ['Company A', 'Company C']]
+    }, index=[1, 1])
+
+    result = message_generator.generate_messages(mock_stakeholders_df, mock_companies_df, events_df)
+
+    assert list(result['template_type']) == ['event_based', 'event_based', 'event_based']
+    assert result.loc[1, 'subject'] == 'Meeting at Print Show? DuPont Tedlar innovations'
+    assert 'in Chicago this May' in result.loc[0, 'body']
+
+
+@pytest.mark.parametrize('relevance_scores', [None, [float('nan'), float('nan')]], ids=['missing', 'all_nan'])
+def test_generate_messages_unscored_events(message_generator, mock_stakeholders_df, mock_companies_df, monkeypatch,
+                                           relevance_scores):
+    """Test that events without relevance scores fall back to the first event"""
+    monkeypatch.setattr(message_generator, 'client', None)
+    events_df = pd.DataFrame({
+        'name': ['Sign Expo', 'Print Show'],
+        'location': ['Las Vegas', 'Chicago'],
+        'date': ['April', 'May'],
+        'exhibitors': [['Company C'], ['Company A']]
+    })
+    if relevance_scores is not None:
+        events_df['relevance_score'] = relevance_scores
+
+    # No stakeholder exhibits, so the events are never ranked
+    result = message_generator.generate_messages(mock_stakeholders_df, mock_companies_df, events_df.iloc[:1])
+    assert 'event_based' not in list(result['template_type'])
+
+    result = message_generator.generate_messages(mock_stakeholders_df, mock_companies_df, events_df)
+    assert list(result['template_type']) == ['event_based', 'initial_outreach', 'event_based']
+    assert result.loc[0, 'subject'] == 'Meeting at Sign Expo? DuPont Tedlar innovations'
+
+
+def test_format_products_and_application(message_generator):
+    """Test the per-company product and application phrases"""
+    assert message_generator._format_products(['Signs', 'Banners', 'Wraps']) == 'Signs, Banners'
+    assert message_generator._format_products('Signs') == 'Signs'
+    assert message_generator._format_products([]) == 'products and services'
+    assert message_generator._format_application(['Retail', 'Events']) == 'Retail'
+    assert message_generator._format_application('') == 'signage and graphics'
+
+
+def test_generate_ai_message_uses_cache(message_generator, patched_openai, monkeypatch, tmp_path):
+    """Test that identical prompts are only sent to OpenAI once"""
+    patched_openai.requests.clear()
+    monkeypatch.setattr(message_generator, 'openai_cache', FileCache(tmp_path, ttl=60))
+
+    message_vars = {
+        'name': 'John Doe', 'title': 'CEO', 'company': 'Company A', 'industry': 'Signage',
+        'products_or_services': 'Signs', 'specific_application': 'Retail'
+    }
+    expected = {'subject': 'Tedlar for Company A', 'body': 'Hello'}
+
+    assert message_generator._generate_ai_message(message_vars) == expected
+    assert message_generator._generate_ai_message(dict(message_vars)) == expected
+    assert len(patched_openai.requests) == 1
+
+
+def test_parse_ai_message(message_generator):
+    """Test parsing JSON responses, rejecting anything without a subject and body"""
+    assert message_generator._parse_ai_message('{"subject": "Hi", "body": "Hello"}') == {'subject': 'Hi', 'body': 'Hello'}
+    assert message_generator._parse_ai_message('Subject: Hi\nBody: Hello') is None
+    assert message_generator._parse_ai_message('{"subject": "Hi"}') is None
+    assert message_generator._parse_ai_message('["Hi", "Hello"]') is None
+
+
+def test_select_template_types(message_generator):
+    """Test vectorized template selection"""
+    stakeholders_df = pd.DataFrame({
+        'company': ['Company A', 'COMPANY B', 'Company C', 'Company D'],
+        'priority_score': [0.5, 0.9, 0.7, 0.69]
+    })
+    event_companies = frozenset({'company a', 'company b'})
+
+    result = message_generator._select_template_types(stakeholders_df, event_companies)
+
+    assert result == ['event_based', 'event_based', 'initial_outreach', 'follow_up']
+    assert message_generator._select_template_types(stakeholders_df[['company']], frozenset()) == ['follow_up'] * 4
+
+
+def test_generate_messages_unknown_company(message_generator, mock_stakeholders_df, mock_companies_df, monkeypatch):
+    """Test that stakeholders of unknown companies get no message"""
+    monkeypatch.setattr(message_generator, 'client', None)
+    companies_df = pd.concat([mock_companies_df, pd.DataFrame({'name': [None], 'industry': ['Other']})], ignore_index=True)
+    stakeholders_df = mock_stakeholders_df.assign(company=['Company A', 'Company X', 'Company A'])
+
+    result = message_generator.generate_messages(stakeholders_df, companies_df)
+
+    assert list(result['company']) == ['Company A', 'Company X', 'Company A']
+    assert result['subject'].isna().tolist() == [False, True, False]
+
+
+def test_prepare_prompt(message_generator, patched_openai, monkeypatch, tmp_path, first_lead, companies_by_name):
+    """Test the prompt sent to OpenAI for a lead"""
+    patched_openai.requests.clear()
+    monkeypatch.setattr(message_generator, 'openai_cache', FileCache(tmp_path, ttl=60))
+
+    lead = first_lead
+
     # Get the corresponding company
-    company_info = mock_companies_df[mock_companies_df['name'] == lead['company']].iloc[0].to_dict()
-    
+    company_info = companies_by_name[lead['company']]
+
     # Add company info to lead
     lead.update({
-        'company_info': company_info
+        'industry': company_info['industry'],
+        'products_or_services': message_generator._format_products(company_info['products']),
+        'specific_application': message_generator._format_application(company_info['target_markets'])
     })
-    
-    # Generate prompt
-    prompt = message_generator._prepare_prompt(lead)
-    
+
+    # Generate a message, recording the prompt
+    message_generator._generate_ai_message(message_generator._build_message_vars(lead, 'initial_outreach', None))
+    prompt = patched_openai.requests[0]['messages'][-1]['content']
+
     # Check that the prompt contains relevant information
     assert isinstance(prompt, str)
     assert lead['name'] in prompt
     assert lead['company'] in prompt
     assert lead['title'] in prompt
-    assert 'personalized outreach message' in prompt.lower()
\ No newline at end of file
+    assert 'Signs, Banners' in prompt
+    assert 'personalized sales outreach email' in prompt.lower()
@@ -0,0 +1,17 @@
+import time
+
+from src.utils.rate_limiter import RateLimiter
+
+
+def test_acquire_allows_burst_then_waits():
+    """Test that a full bucket allows a burst and then spaces out calls"""
+    limiter = RateLimiter(max_rate=5, time_period=1.0)
+
+    start = time.monotonic()
+    for _ in range(5):
+        limiter.acquire()
+    assert time.monotonic() - start < 0.1
+
+    # The sixth call has to wait for a token to be refilled (0.2s at 5 per second)
+    limiter.acquire()
+    assert time.monotonic() - start >= 0.15
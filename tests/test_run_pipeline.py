@@ -0,0 +1,53 @@
+import os
+import pandas as pd
+
+import run_pipeline
+
+
+def test_run_stage_reuses_cache(tmp_path, monkeypatch):
+    """Test that a stage is only recomputed when its upstream output is newer"""
+    monkeypatch.setattr(run_pipeline, 'STAGE_CACHE_DIR', tmp_path)
+    calls = []
+
+    def compute():
+        calls.append('companies')
+        return pd.DataFrame({'name': ['Company A'], 'products': [['Signs']]})
+
+    run_pipeline.run_stage('events', lambda: pd.DataFrame({'name': ['ISA Sign Expo']}))
+    first = run_pipeline.run_stage('companies', compute, upstreams=('events',))
+    cached = run_pipeline.run_stage('companies', compute, upstreams=('events',))
+
+    assert calls == ['companies']
+    pd.testing.assert_frame_equal(cached, first)
+
+    # A newer upstream output invalidates the cached stage
+    events_path = tmp_path / 'events.parquet'
+    newer = (tmp_path / 'companies.parquet').stat().st_mtime + 10
+    os.utime(events_path, (newer, newer))
+    run_pipeline.run_stage('companies', compute, upstreams=('events',))
+
+    assert calls == ['companies', 'companies']
+
+    # Refreshing always recomputes
+    run_pipeline.run_stage('companies', compute, upstreams=('events',), refresh=True)
+
+    assert len(calls) == 3
+
+
+def test_run_stage_tracks_settings(tmp_path, monkeypatch):
+    """Test that a stage is recomputed when its settings change"""
+    monkeypatch.setattr(run_pipeline, 'STAGE_CACHE_DIR', tmp_path)
+    calls = []
+
+    def compute():
+        calls.append('messages')
+        return pd.DataFrame({'subject': ['Hello']})
+
+    run_pipeline.run_stage('messages', compute, settings={'model': 'gpt-4o', 'weights': {'a': 0.5}})
+    run_pipeline.run_stage('messages', compute, settings={'weights': {'a': 0.5}, 'model': 'gpt-4o'})
+
+    assert calls == ['messages']
+
+    run_pipeline.run_stage('messages', compute, settings={'model': 'gpt-4o', 'weights': {'a': 0.6}})
+
+    assert calls == ['messages', 'messages']
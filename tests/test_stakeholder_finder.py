@@ -0,0 +1,106 @@
+import pytest
+import pandas as pd
+
+from src.data_enrichment.stakeholder_finder import StakeholderFinder
+
+
+@pytest.fixture
+def stakeholder_finder():
+    """Create a StakeholderFinder instance for testing"""
+    return StakeholderFinder()
+
+
+@pytest.fixture
+def mock_companies_df():
+    """Create a mock companies DataFrame for testing"""
+    companies_data = {
+        'name': ['Company A', 'Company B', 'Company C'],
+        'website': ['https://www.companya.com/about', '', None]
+    }
+    return pd.DataFrame(companies_data, index=[7, 3, 5])
+
+
+def test_generate_synthetic_stakeholders(stakeholder_finder, mock_companies_df):
+    """Test bulk generation of synthetic stakeholders"""
+    result = stakeholder_finder._generate_synthetic_stakeholders(mock_companies_df)
+
+    assert isinstance(result, pd.DataFrame)
+    assert set(result.index) == {7, 3, 5}
+
+    for label, group in result.groupby(level=0):
+        company = mock_companies_df.loc[label]
+
+        # 2-4 stakeholders per company, numbered from 1
+        assert 2 <= len(group) <= 4
+        assert list(group['first_name']) == [f"FirstName{i}" for i in range(1, len(group) + 1)]
+        assert (group['company'] == company['name']).all()
+
+        # Titles are drawn from the configured decision-maker titles
+        all_titles = {title for titles in stakeholder_finder.relevant_titles.values() for title in titles}
+        assert set(group['title']) <= all_titles
+
+    emails = result.loc[7, 'email']
+    assert emails.str.endswith('@companya.com').all()
+    assert result.loc[3, 'email'].str.endswith('@companyb.com').all()
+    assert result.loc[5, 'email'].str.endswith('@companyc.com').all()
+
+
+def test_find_stakeholders_with_hunter_concurrently(stakeholder_finder, monkeypatch):
+    """Test that concurrent Hunter.io lookups are returned under their keys"""
+    monkeypatch.setattr(
+        stakeholder_finder,
+        '_find_stakeholders_with_hunter',
+        lambda domain, company_name: [{'email': f"info@{domain}", 'company': company_name}]
+    )
+
+    lookups = {0: ('companya.com', 'Company A'), 2: ('companyc.com', 'Company C')}
+    result = stakeholder_finder._find_stakeholders_with_hunter_concurrently(lookups)
+
+    assert set(result) == {0, 2}
+    assert result[0] == [{'email': 'info@companya.com', 'company': 'Company A'}]
+    assert result[2] == [{'email': 'info@companyc.com', 'company': 'Company C'}]
+    assert stakeholder_finder._find_stakeholders_with_hunter_concurrently({}) == {}
+
+
+def test_extract_domains(stakeholder_finder):
+    """Test vectorized domain extraction matches the scalar helper"""
+    urls = pd.Series(['HTTPS://www.CompanyA.com/about?x=1', 'companyb.com', 'http://shop.companyc.com', '', None])
+    result = stakeholder_finder._extract_domains(urls)
+
+    assert list(result) == ['companya.com', 'companyb.com', 'shop.companyc.com', '', '']
+    assert list(result) == [stakeholder_finder._extract_domain(url) for url in urls]
+
+
+def test_calculate_decision_powers(stakeholder_finder):
+    """Test batch decision power scoring matches the per-title scoring"""
+    titles = pd.Series(['CEO', 'Procurement Manager', 'Engineering Manager', 'Sales Manager', 'Intern', '', None])
+    result = stakeholder_finder._calculate_decision_powers(titles)
+
+    assert list(result) == [0.9, 0.8, 0.7, 0.6, 0.5, 0.5, 0.5]
+    assert list(result) == [stakeholder_finder._calculate_decision_power_from_title(title) for title in titles]
+
+
+def test_find_stakeholders_shares_hunter_lookups(stakeholder_finder, monkeypatch, tmp_path):
+    """Test that companies sharing a domain are searched on Hunter.io once"""
+    import src.data_enrichment.stakeholder_finder as stakeholder_finder_module
+
+    searched = []
+
+    def fake_hunter(domain, company_name):
+        searched.append(domain)
+        return [{'email': f"info@{domain}", 'title': 'CEO', 'company': company_name}]
+
+    monkeypatch.setattr(stakeholder_finder_module, 'HUNTER_API_KEY', 'test-key')
+    monkeypatch.setattr(stakeholder_finder, 'output_dir', tmp_path)
+    monkeypatch.setattr(stakeholder_finder, '_find_stakeholders_with_hunter', fake_hunter)
+
+    companies_df = pd.DataFrame({
+        'name': ['Company A', 'Company A Europe', 'Company C'],
+        'website': ['https://www.companya.com', 'companya.com/eu', None]
+    })
+    result = stakeholder_finder.find_stakeholders(companies_df)
+
+    assert searched == ['companya.com']
+    assert list(result['company'][:2]) == ['Company A', 'Company A Europe']
+    assert (result['company'][2:] == 'Company C').all()
+    assert (tmp_path / 'stakeholders.parquet').exists()
@@ -0,0 +1,12 @@
+import re
+import pandas as pd
+
+from src.utils.text import count_keyword_matches
+
+
+def test_count_keyword_matches():
+    """Test per-row keyword counts over list, string and missing values"""
+    values = pd.Series([['Signs', 'Vinyl Banners', 'Wood'], 'Graphics', [], None, ['sign'] * 5], index=[3, 1, 4, 1, 5])
+
+    assert list(count_keyword_matches(values, 'sign|banner|graphic')) == [2, 1, 0, 0, 5]
+    assert list(count_keyword_matches(values, re.compile('sign'), max_count=3)) == [1, 0, 0, 0, 3]